@@ -1,19 +1,27 @@
 import discord
 from discord.ext import commands
 import asyncio
+import bisect
 from typing import List, Optional
 import random
 
-from models import Application, Server, Player, Card
-from config import GameState, logger
+from models import Application, Server, Player, Card, hand_sort_key
+from config import GameState, CARD_RANKS, logger
 from utils.helpers import (
-    batch_discord_operations, 
-    safe_delete_message, 
+    batch_discord_operations,
+    delete_with_retry,
+    safe_delete_message,
     safe_send_message,
     is_game_active,
-    is_player_turn
+    is_player_turn,
+    in_player_channel
 )
 
+def _spawn_delete(message):
+    """Delete a message in the background without blocking the command."""
+    return asyncio.create_task(safe_delete_message(message))
+
+
 class DurakGame(commands.Cog):
     """Cog for the Durak card game commands."""
     
@@ -26,104 +34,108 @@ class DurakGame(commands.Cog):
         """Event handler when the bot is ready."""
         logger.info(f'Bot is up and running as {self.bot.user}')
     
-    @commands.Cog.listener()
-    async def on_message(self, message):
-        """Event handler for messages to handle game setup commands."""
-        if message.author == self.bot.user or not message.guild:
+    @commands.command(name='durak')
+    async def durak_setup(self, ctx):
+        """Set up a new Durak game in this server."""
+        server = self.app.get_server(ctx.guild)
+        await safe_delete_message(ctx.message)
+        await safe_send_message(ctx.channel, "Type /join to join the game.")
+        server.state = GameState.SETUP
+        server.reset_players()
+
+    @commands.command(name='join')
+    async def join(self, ctx):
+        """Join a Durak game that is being set up."""
+        server = self.app.get_server(ctx.guild)
+        if server.state != GameState.SETUP:
             return
-        
-        server = self.app.get_server(message.guild)
-        
-        if message.content.startswith('/durak'):
-            await safe_delete_message(message)
-            await safe_send_message(message.channel, "Type /join to join the game.")
-            server.state = GameState.SETUP
-            server.players = {}
-        
-        elif server.state == GameState.SETUP and message.content.startswith('/join'):
-            if message.author not in server.players:
-                server.add_player(message.author)
-                await safe_send_message(message.channel, f'{message.author.display_name} joined the game.')
-                await safe_delete_message(message)
-            else:
-                await safe_send_message(message.channel, f'{message.author.display_name} is already in the game.')
+
+        if ctx.author.id not in server.players:
+            server.add_player(ctx.author)
+            await safe_send_message(ctx.channel, f'{ctx.author.display_name} joined the game.')
+            await safe_delete_message(ctx.message)
+        else:
+            await safe_send_message(ctx.channel, f'{ctx.author.display_name} is already in the game.')
     
+    async def _setup_player(self, ctx, p, players_list, sem):
+        """Provision one player's role, channel and opening messages."""
+        member = p.author
+        async with sem:
+            # Create role for the player
+            role_name = f'durak {p.number}'
+            role = await ctx.guild.create_role(name=role_name, colour=discord.Colour.random())
+            await member.add_roles(role)
+
+            # Create private channel
+            channel_name = f'durak-{member.display_name}-room'.lower().replace(' ', '-')
+            channel = await ctx.guild.create_text_channel(channel_name)
+            await channel.set_permissions(role, send_messages=True, read_messages=True)
+            await channel.set_permissions(ctx.guild.default_role, read_messages=False)
+            p.channel = channel
+
+            # Send initial messages
+            await safe_send_message(channel, f'Players in the game: {players_list}')
+
+            cards_str = ' '.join([str(card) for card in p.hand])
+            p.cards_message = await safe_send_message(channel, f'Here are your cards: ```{cards_str}```')
+
     @commands.command(name='start')
     async def start_game(self, ctx):
         """Start a Durak game with the joined players."""
         await safe_delete_message(ctx.message)
         server = self.app.get_server(ctx.guild)
-        
+
         if server.state != GameState.SETUP or len(server.players) < 2:
             await safe_send_message(ctx.channel, "Not enough players or game not set up. Use /durak to set up a game.")
             return
-        
+
         # Initialize game state
         server.state = GameState.PLAYING
         server.initialize_deck()
         server.attacker = None
-        lowest_trump = None
-        
-        # Create player channels and deal cards
-        for player in server.players:
-            # Create role for the player
-            role_name = f'durak {server.players[player].number}'
-            try:
-                role = await ctx.guild.create_role(name=role_name, colour=discord.Colour.random())
-                await player.add_roles(role)
-            except discord.errors.Forbidden:
-                logger.error(f"No permission to create/assign roles in {ctx.guild.name}")
-                await safe_send_message(ctx.channel, "Failed to create roles. Check bot permissions.")
+
+        # Deal cards locally, then provision all players concurrently
+        for p in server.players.values():
+            p.hand = sorted((server.deck.pop() for _ in range(6)), key=hand_sort_key)
+
+        players_list = ", ".join([p.author.display_name for p in server.players.values()])
+        sem = asyncio.Semaphore(8)
+        tasks = [
+            self._setup_player(ctx, p, players_list, sem)
+            for p in server.players.values()
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, discord.errors.Forbidden):
+                logger.error(f"No permission to create roles/channels in {ctx.guild.name}")
+                await safe_send_message(ctx.channel, "Failed to create roles or channels. Check bot permissions.")
                 return
-            
-            # Create private channel
-            channel_name = f'durak-{player.display_name}-room'.lower().replace(' ', '-')
-            try:
-                channel = await ctx.guild.create_text_channel(channel_name)
-                await channel.set_permissions(role, send_messages=True, read_messages=True)
-                await channel.set_permissions(ctx.guild.default_role, read_messages=False)
-            except discord.errors.Forbidden:
-                logger.error(f"No permission to create channels in {ctx.guild.name}")
-                await safe_send_message(ctx.channel, "Failed to create channels. Check bot permissions.")
+            elif isinstance(result, Exception):
+                logger.error(f"Error setting up player: {str(result)}")
+                await safe_send_message(ctx.channel, "Failed to set up the game. Check bot permissions.")
                 return
-            
-            # Set up player
-            p = server.players[player]
-            p.channel = channel
-            p.hand = [server.deck.pop(0) for _ in range(6)]
-            
-            # Check for lowest trump
-            for card in p.hand:
-                if card.suit == server.trump_card.suit:
-                    if lowest_trump is None or card.rank < lowest_trump:
-                        lowest_trump = card.rank
-                        server.attacker = p
-            
-            # Send initial messages
-            players_list = ", ".join([player.display_name for player in server.players])
-            await safe_send_message(channel, f'Players in the game: {players_list}')
-            
-            cards_str = ' '.join([str(card) for card in p.hand])
-            p.cards_message = await safe_send_message(channel, f'Here are your cards: ```{cards_str}```')
+
+        # The attacker is whoever holds the lowest trump: a single min-reduction
+        trump_suit = server.trump_card.suit
+        candidates = [
+            (CARD_RANKS[card.rank], p)
+            for p in server.players.values()
+            for card in p.hand
+            if card.suit == trump_suit
+        ]
+        if candidates:
+            server.attacker = min(candidates, key=lambda t: t[0])[1]
         
         # Set initial attacker and defender
         if server.attacker is None:
-            server.attacker = list(server.players.values())[0]
-        
-        players_by_number = sorted(server.players.values(), key=lambda p: p.number)
-        attacker_index = next(i for i, p in enumerate(players_by_number) if p == server.attacker)
-        defender_index = (attacker_index + 1) % len(players_by_number)
-        server.defender = players_by_number[defender_index]
+            server.attacker = next(iter(server.players.values()))
+
+        server._attacker_idx = server._order.index(server.attacker)
+        server.defender = server._order[(server._attacker_idx + 1) % len(server._order)]
         
         # Send game status to all players
-        for player in server.players:
-            p = server.players[player]
-            p.attacker_message = await safe_send_message(
-                p.channel,
-                f'Attacker: ***{server.attacker.author.display_name}***\n'
-                f'Defender: ***{server.defender.author.display_name}***'
-            )
-            
+        for p in server.players.values():
             p.table_message = await safe_send_message(p.channel, 'Table: ```(empty)\nDeck: loading...```')
         
         await server.update_table()
@@ -136,16 +148,13 @@ class DurakGame(commands.Cog):
     @commands.command(name='play')
     @is_game_active()
     @is_player_turn(attacker=True)
+    @in_player_channel()
     async def play(self, ctx, *cards):
         """Play cards as the attacker."""
-        await safe_delete_message(ctx.message)
+        _spawn_delete(ctx.message)
         server = self.app.get_server(ctx.guild)
         player = server.get_player(ctx.author)
         
-        # Validate channel
-        if ctx.channel != player.channel:
-            return
-        
         # Validate cards
         if not cards:
             await player.send_error(ctx, "Please specify which card(s) to play.")
@@ -166,23 +175,21 @@ class DurakGame(commands.Cog):
                 return
             
             # Check if cards match values on the table
-            if server.table:
-                allowed_values = set()
-                for atk, dfn in server.table:
-                    allowed_values.add(atk.rank)
-                    if dfn:
-                        allowed_values.add(dfn.rank)
-                
-                if not all(card.rank in allowed_values for card in card_objects):
-                    await player.send_error(ctx, 
-                        "You can only play cards that match the rank of any card on the table."
-                    )
-                    return
-            
-            # Play the cards
+            if server._table_ranks and not all(card.rank in server._table_ranks for card in card_objects):
+                await player.send_error(ctx,
+                    "You can only play cards that match the rank of any card on the table."
+                )
+                return
+
+            # Play the cards: push to the table, then drop them all in one pass
+            to_remove = set(card_objects)
+            if len(to_remove) != len(card_objects):
+                await player.send_error(ctx, "You do not have these cards.")
+                return
+
             for card_obj in card_objects:
-                player.hand.remove(card_obj)
-                server.table.append((card_obj, None))
+                server._push_attack(card_obj)
+            player.hand = [c for c in player.hand if c not in to_remove]
             
             # Update defender's tip
             await server.defender.send_tip("Type /defend <card(s)> to defend or /take to take the cards.")
@@ -194,7 +201,7 @@ class DurakGame(commands.Cog):
                 )
             
             # Update displays
-            await server.update_hand(ctx.author)
+            await server.update_hand(player)
             await server.update_table()
             
         except ValueError as e:
@@ -203,16 +210,13 @@ class DurakGame(commands.Cog):
     @commands.command(name='defend')
     @is_game_active()
     @is_player_turn(defender=True)
+    @in_player_channel()
     async def defend(self, ctx, *cards):
         """Defend against attack cards."""
-        await safe_delete_message(ctx.message)
+        _spawn_delete(ctx.message)
         server = self.app.get_server(ctx.guild)
         player = server.get_player(ctx.author)
         
-        # Validate channel
-        if ctx.channel != player.channel:
-            return
-        
         # Check if there are cards to defend against
         if not server.table:
             await player.send_error(ctx, "There are no cards to defend against.")
@@ -259,14 +263,18 @@ class DurakGame(commands.Cog):
                 await player.send_error(ctx, "These cards are not a valid defence.")
                 return
             
-            # Apply the defense
+            # Apply the defense: fill the table slots, then drop all cards in one pass
+            to_remove = set(card_objects)
+            if len(to_remove) != len(card_objects):
+                await player.send_error(ctx, "You do not have these cards.")
+                return
+
             for j, i in enumerate(undefended):
-                defense_card = card_objects[j]
-                server.table[i] = (server.table[i][0], defense_card)
-                player.hand.remove(defense_card)
+                server._push_defense(i, card_objects[j])
+            player.hand = [c for c in player.hand if c not in to_remove]
             
             # Update displays
-            await server.update_hand(ctx.author)
+            await server.update_hand(player)
             await server.update_table()
             
             # If all cards are now defended, update attacker's tip
@@ -281,16 +289,13 @@ class DurakGame(commands.Cog):
     @commands.command(name='take')
     @is_game_active()
     @is_player_turn(defender=True)
+    @in_player_channel()
     async def take(self, ctx):
         """Take all cards from the table as the defender."""
-        await safe_delete_message(ctx.message)
+        _spawn_delete(ctx.message)
         server = self.app.get_server(ctx.guild)
         player = server.get_player(ctx.author)
         
-        # Validate channel
-        if ctx.channel != player.channel:
-            return
-        
         # Check if there are cards to take
         if not server.table:
             await player.send_error(ctx, "There are no cards to take.")
@@ -303,9 +308,9 @@ class DurakGame(commands.Cog):
         
         # Take all cards
         for attack_card, defense_card in server.table:
-            player.hand.append(attack_card)
+            bisect.insort(player.hand, attack_card, key=hand_sort_key)
             if defense_card:
-                player.hand.append(defense_card)
+                bisect.insort(player.hand, defense_card, key=hand_sort_key)
         
         # End the turn
         await self.end_turn(server, turn_taken=True)
@@ -313,16 +318,13 @@ class DurakGame(commands.Cog):
     @commands.command(name='giveup')
     @is_game_active()
     @is_player_turn(attacker=True)
+    @in_player_channel()
     async def giveup(self, ctx):
         """End your attack and pass the turn."""
-        await safe_delete_message(ctx.message)
+        _spawn_delete(ctx.message)
         server = self.app.get_server(ctx.guild)
         player = server.get_player(ctx.author)
         
-        # Validate channel
-        if ctx.channel != player.channel:
-            return
-        
         # Check if there are cards on the table
         if not server.table:
             await player.send_error(ctx, "You must play at least one card before you can give up.")
@@ -338,62 +340,53 @@ class DurakGame(commands.Cog):
     
     async def end_turn(self, server: Server, turn_taken: bool):
         """End the current turn and set up the next one."""
-        players_by_number = sorted(server.players.values(), key=lambda p: p.number)
-        old_attacker = server.attacker
-        old_defender = server.defender
-        
+        order = server._order
+
         # Clean up messages
         for p in server.players.values():
             await p.cleanup_messages()
-        
-        # Determine next attacker and defender
+
+        # Determine next attacker and defender; the defender always sits at
+        # _attacker_idx + 1, so rotation is plain index arithmetic
         if turn_taken:
             # Defender took cards: attacker = player after defender
-            def_index = next(i for i, p in enumerate(players_by_number) if p == old_defender)
-            start_index = (def_index + 1) % len(players_by_number)
+            server._attacker_idx = (server._attacker_idx + 2) % len(order)
         else:
             # Attackers gave up: defender becomes attacker
-            start_index = next(i for i, p in enumerate(players_by_number) if p == old_defender)
-        
-        server.attacker = players_by_number[start_index]
-        server.defender = players_by_number[(start_index + 1) % len(players_by_number)]
-        server.table = []
-        
-        # Update player messages
-        update_tasks = []
-        for p in server.players.values():
-            update_tasks.append(lambda p=p: p.attacker_message.edit(content=
-                f'Attacker: ***{server.attacker.author.display_name}***\n'
-                f'Defender: ***{server.defender.author.display_name}***'
-            ))
-        
-        await batch_discord_operations(update_tasks)
-        
+            server._attacker_idx = (server._attacker_idx + 1) % len(order)
+
+        server.attacker = order[server._attacker_idx]
+        server.defender = order[(server._attacker_idx + 1) % len(order)]
+        server.clear_table()
+
         # Refill hands
         await server.refill_hands()
         
         # Check win condition
         if len(server.players) == 1:
-            durak = list(server.players.values())[0]
+            durak = next(iter(server.players.values()))
             
             # Notify finished players
             notification_tasks = []
             for fin_author in server.finished_players:
                 notification_tasks.append(
-                    lambda author=fin_author: safe_send_message(
-                        author, f"Game over! ***{durak.author.display_name}*** is the Durak!"
+                    safe_send_message(
+                        fin_author, f"Game over! ***{durak.author.display_name}*** is the Durak!"
                     )
                 )
-            
+
             await batch_discord_operations(notification_tasks)
             
             # Grant "Ultimate Durak" role
             try:
                 guild = durak.channel.guild
-                durak_role = discord.utils.get(guild.roles, name="Ultimate Durak")
-                if not durak_role:
+                durak_role = guild.get_role(server.durak_role_id) if server.durak_role_id else None
+                if durak_role is None:
+                    durak_role = discord.utils.get(guild.roles, name="Ultimate Durak")
+                if durak_role is None:
                     durak_role = await guild.create_role(name="Ultimate Durak", colour=discord.Colour.dark_red())
-                
+                server.durak_role_id = durak_role.id
+
                 await durak.author.add_roles(durak_role)
             except discord.errors.Forbidden:
                 logger.error(f"No permission to create/assign 'Ultimate Durak' role")
@@ -408,11 +401,8 @@ class DurakGame(commands.Cog):
             server.trump_taken = True
         
         # Update all displays
-        update_tasks = []
-        for player in server.players:
-            update_tasks.append(lambda p=player: server.update_hand(p))
-        
-        update_tasks.append(lambda: server.update_table())
+        update_tasks = [server.update_hand(p) for p in server.players.values()]
+        update_tasks.append(server.update_table())
         await batch_discord_operations(update_tasks)
         
         # Attacker gets a tip to start turn
@@ -425,24 +415,40 @@ class DurakGame(commands.Cog):
     async def delete_all(self, ctx):
         """Delete all Durak game channels and roles (admin only)."""
         guild = ctx.guild
-        
-        # Delete roles
+
+        # Collect everything to delete, then fire the deletions concurrently
         roles_to_delete = [role for role in guild.roles if role.name.startswith("durak")]
-        for role in roles_to_delete:
-            try:
-                await role.delete()
-                await safe_send_message(ctx.channel, f'Deleted role: {role.name}')
-            except discord.errors.Forbidden:
-                await safe_send_message(ctx.channel, f'No permission to delete role: {role.name}')
-        
-        # Delete channels
         channels_to_delete = [channel for channel in guild.text_channels if channel.name.startswith("durak")]
-        for channel in channels_to_delete:
-            try:
-                await channel.delete()
-                await safe_send_message(ctx.channel, f'Deleted channel: {channel.name}')
-            except discord.errors.Forbidden:
-                await safe_send_message(ctx.channel, f'No permission to delete channel: {channel.name}')
+        targets = roles_to_delete + channels_to_delete
+
+        if not targets:
+            await safe_send_message(ctx.channel, "No Durak roles or channels to delete.")
+            return
+
+        semaphore = asyncio.Semaphore(5)
+        results = await asyncio.gather(
+            *(delete_with_retry(target, semaphore) for target in targets),
+            return_exceptions=True
+        )
+
+        deleted = [t.name for t, ok in zip(targets, results) if ok is True]
+        failed = [t.name for t, ok in zip(targets, results) if ok is not True]
+
+        # One summary message instead of one message per deletion
+        embed = discord.Embed(title="Durak Cleanup", color=discord.Color.blue())
+        embed.add_field(
+            name=f"Deleted ({len(deleted)})",
+            value="\n".join(deleted) if deleted else "(none)",
+            inline=False
+        )
+        if failed:
+            embed.add_field(
+                name=f"Failed ({len(failed)})",
+                value="\n".join(failed),
+                inline=False
+            )
+
+        await safe_send_message(ctx.channel, embed=embed)
     
     @commands.command(name='help_durak')
     async def help_durak(self, ctx):
@@ -4,7 +4,6 @@ import random
 import os
 import asyncio
 import logging
-from enum import Enum
 from typing import Dict, List, Set, Tuple, Optional
 from dotenv import load_dotenv
 
@@ -28,39 +27,101 @@ if not token:
     logger.error("No Discord token found. Please set the DISCORD_TOKEN1 environment variable.")
     raise ValueError("No Discord token found. Please set the DISCORD_TOKEN1 environment variable.")
 
-# Game state enum
-class GameState(Enum):
+# Game states as plain ints: state checks run at the top of every command,
+# and int equality is markedly cheaper than Enum.__eq__
+class GameState:
     SETUP = 0
     PLAYING = 1
     FINISHED = 2
 
-# Card class for better representation
-class Card:
-    def __init__(self, rank, suit):
-        self.rank = rank
-        self.suit = suit
-    
-    def __str__(self):
-        return f"{self.rank}{self.suit}"
-    
-    def __eq__(self, other):
-        if not isinstance(other, Card):
-            return False
-        return self.rank == other.rank and self.suit == other.suit
+# Cards are packed ints: card = suit_index * 9 + rank_index, 0-35.
+# Ints compare, hash and copy with no per-card allocation, and the string
+# forms are precomputed once for display and parsing.
+RANKS = ('6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+SUITS = ('♥️', '♦️', '♣️', '♠️')
+CARD_STR = tuple(f"{RANKS[card % 9]}{SUITS[card // 9]}" for card in range(36))
+STR_TO_CARD = {s: i for i, s in enumerate(CARD_STR)}
+
+async def _safe(coro, what=""):
+    """Await a Discord call, logging with traceback instead of raising on failure."""
+    try:
+        return await coro
+    except Exception:
+        logger.exception(what)
+
+def iter_hand(mask):
+    """Yield the card ints set in a hand mask, lowest (suit, rank) first."""
+    while mask:
+        lsb = mask & -mask
+        yield lsb.bit_length() - 1
+        mask ^= lsb
+
+# Static halves of the display messages, joined around the dynamic middle
+_HAND_PREFIX = 'Here are your cards: ```'
+_TABLE_PREFIX = 'Table: ```'
+_CODE_SUFFIX = '```'
 
 # Set up Discord bot
 intents = discord.Intents.all()
 client = commands.Bot(command_prefix='/', intents=intents)
 
+class ChannelWorker:
+    """Serializes Discord REST calls for one channel.
+
+    Each channel gets its own queue and consumer task, so traffic within a
+    channel stays in order (one rate-limit bucket at a time) while separate
+    channels still proceed in parallel.
+    """
+
+    def __init__(self):
+        self.queue = asyncio.Queue()
+        self.task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            coro = await self.queue.get()
+            try:
+                await coro
+            except Exception as e:
+                logger.error(f"Channel worker operation failed: {str(e)}")
+            finally:
+                self.queue.task_done()
+
+    def submit(self, coro):
+        """Queue a coroutine to run after everything already queued for this channel."""
+        self.queue.put_nowait(coro)
+
+    def close(self):
+        """Cancel the consumer and close any coroutines still queued."""
+        self.task.cancel()
+        while not self.queue.empty():
+            self.queue.get_nowait().close()
+
+
 class Application:
     def __init__(self):
         self.servers = {}
+        self.ultimate_role_ids = {}  # guild.id -> "Ultimate Durak" role id
 
     def get_server(self, guild):
         if guild.id not in self.servers:
             self.servers[guild.id] = Server(guild.id, guild.name)
         return self.servers[guild.id]
 
+    def get_ultimate_durak(self, guild):
+        """Return the "Ultimate Durak" role for a guild, scanning its roles at most once.
+
+        The cache holds the role id; guild.get_role is a dict probe into
+        discord.py's own id->role map, so a stale role never sticks around.
+        """
+        role_id = self.ultimate_role_ids.get(guild.id)
+        role = guild.get_role(role_id) if role_id else None
+        if role is None:
+            role = discord.utils.get(guild.roles, name="Ultimate Durak")
+            if role:
+                self.ultimate_role_ids[guild.id] = role.id
+        return role
+
 class Server:
     def __init__(self, id, name):
         self.id = id
@@ -70,134 +131,144 @@ class Server:
         self.players = {}
         self.deck = []
         self.trump_card = None
+        self.trump_suit = None
         self.table = []
+        self._undefended_count = 0  # attack cards on the table awaiting a defense
         self.attacker = None
         self.defender = None
         self.finished_players = set()  # authors who completed the game
-        self.card_ranks = {'6': 0, '7': 1, '8': 2, '9': 3, '10': 4, 'J': 5, 'Q': 6, 'K': 7, 'A': 8}
+        self._ordered = []  # players in join order; each knows its own index
+        self._table_dirty = False
+        self._table_task = None
+        self._player_role = {}  # player number -> role, filled at creation time
+        self.created_roles = []  # everything we created, for O(1) cleanup
+        self.created_channels = []
 
     async def update_table(self):
-        """Update the table display for all players."""
-        for player in self.players:
+        """Request a table redraw; rapid successive requests coalesce into one edit."""
+        self._table_dirty = True
+        if self._table_task is None or self._table_task.done():
+            self._table_task = asyncio.create_task(self._flush_table())
+
+    async def _flush_table(self):
+        """Flush pending table updates to every player concurrently."""
+        while self._table_dirty:
+            await asyncio.sleep(0.05)  # let a burst of updates settle into one edit
+            self._table_dirty = False
+
             content = []
             for a, d in self.table:
-                if d:
-                    content.append(f"{a}<-{d}")
+                if d is not None:
+                    content.append(f"{CARD_STR[a]}<-{CARD_STR[d]}")
                 else:
-                    content.append(f"{a}")
+                    content.append(CARD_STR[a])
 
-            if self.trump_card:
-                trump_str = f"{self.trump_card.suit}" if self.trump_taken else f"{self.trump_card}"
+            if self.trump_card is not None:
+                trump_str = SUITS[self.trump_card // 9] if self.trump_taken else CARD_STR[self.trump_card]
             else:
                 trump_str = "?"
 
             deck_status = f"Deck: {len(self.deck)} cards | Trump: {trump_str}"
             table_str = "     ".join(content) if content else "(empty)"
-            
-            try:
-                await self.players[player].table_message.edit(
-                    content=f'Table: ```{table_str}\n{deck_status}```'
-                )
-            except Exception as e:
-                logger.error(f"Failed to update table: {str(e)}")
+
+            full = _TABLE_PREFIX + table_str + '\n' + deck_status + _CODE_SUFFIX
+            for p in self.players.values():
+                p.worker().submit(p.table_message.edit(content=full))
 
     async def update_hand(self, player):
         """Update the hand display for a specific player."""
-        cards = ' '.join([f' {card}' for card in self.players[player].hand])
-        
-        try:
-            await self.players[player].cards_message.edit(
-                content=f'Here are your cards: ```{cards}```'
-            )
-        except Exception as e:
-            logger.error(f"Failed to update hand: {str(e)}")
+        p = self.players[player]
+        content = _HAND_PREFIX + ' '.join(CARD_STR[c] for c in iter_hand(p.hand_mask)) + _CODE_SUFFIX
+        p.worker().submit(p.cards_message.edit(content=content))
 
     def cards_are_in_hand(self, player, cards):
         """Check if all specified cards are in the player's hand."""
-        hand_strings = [str(card) for card in player.hand]
-        return all(card in hand_strings for card in cards)
+        try:
+            needed = 0
+            for card in cards:
+                needed |= 1 << STR_TO_CARD[card]
+        except KeyError:
+            return False
+        return player.hand_mask & needed == needed
 
     async def refill_hands(self):
         """Refill all players' hands to 6 cards if possible."""
-        players_by_number = sorted(self.players.values(), key=lambda p: p.number)
-        start_index = next((i for i, p in enumerate(players_by_number) if p == self.attacker), 0)
+        players_by_number = self._ordered
+        start_index = self.attacker._index if self.attacker else 0
         
         for i in range(len(players_by_number)):
             p = players_by_number[(start_index + i) % len(players_by_number)]
             
-            if len(p.hand) == 0:
+            if p.hand_mask == 0:
                 continue  # already empty, skip draw
             
-            while len(p.hand) < 6 and self.deck:
-                drawn = self.deck.pop(0)
+            while p.hand_mask.bit_count() < 6 and self.deck:
+                drawn = self.deck.pop()
                 if drawn == self.trump_card:
                     self.trump_taken = True
-                p.hand.append(drawn)
+                p.hand_mask |= 1 << drawn
             
             await self.update_hand(p.author)
         
-        # Eliminate players with 0 cards after refill
-        eliminated = []
-        for p in list(self.players.values()):
-            if len(p.hand) == 0:
-                try:
-                    durak_role = discord.utils.get(p.channel.guild.roles, name="Ultimate Durak")
-                    if durak_role in p.author.roles:
-                        await p.author.remove_roles(durak_role)
-                except Exception as e:
-                    logger.error(f"Error removing role: {str(e)}")
-                
-                eliminated.append(p)
+        # Eliminate players with 0 cards after refill; resolve the role once
+        eliminated = [p for p in self.players.values() if p.hand_mask == 0]
+        if eliminated:
+            durak_role = app.get_ultimate_durak(eliminated[0].channel.guild)
+            for p in eliminated:
+                if durak_role and durak_role in p.author.roles:
+                    await _safe(p.author.remove_roles(durak_role), "remove Ultimate Durak role")
         
         for p in eliminated:
             self.finished_players.add(p.author)
-            try:
-                await p.channel.send("🎉 You have finished all your cards!")
-                await p.channel.delete()
-            except Exception as e:
-                logger.error(f"Error with channel operations: {str(e)}")
+            if p._worker:
+                p._worker.close()
+                p._worker = None
+            await _safe(p.channel.send("🎉 You have finished all your cards!"), "finish message")
+            await _safe(p.channel.delete(), "finish channel delete")
             
-            try:
-                role = discord.utils.get(p.channel.guild.roles, name=f"durak {p.number}")
-                if role:
-                    await role.delete()
-            except Exception as e:
-                logger.error(f"Error deleting role: {str(e)}")
+            role = self._player_role.pop(p.number, None)
+            if role:
+                await _safe(role.delete(), "player role delete")
             
+            del self._ordered[p._index]
+            for q in self._ordered[p._index:]:
+                q._index -= 1
             del self.players[p.author]
 
+    def close_workers(self):
+        """Cancel every remaining player's channel worker."""
+        for p in self.players.values():
+            if p._worker:
+                p._worker.close()
+                p._worker = None
+
     def is_defence_success(self, attacking_card, defending_card):
         """Determine if a defense is successful according to Durak rules."""
-        if attacking_card.suit == self.trump_card.suit and defending_card.suit != self.trump_card.suit:
-            return False
-        elif attacking_card.suit != self.trump_card.suit and defending_card.suit == self.trump_card.suit:
-            return True
-        elif defending_card.suit == attacking_card.suit:
-            return self.card_ranks[attacking_card.rank] < self.card_ranks[defending_card.rank]
-        else:
-            return False
+        ts = self.trump_suit
+        a_suit, a_rank = divmod(attacking_card, 9)
+        d_suit, d_rank = divmod(defending_card, 9)
+        return (d_suit == ts and a_suit != ts) or (d_suit == a_suit and d_rank > a_rank)
 
     def initialize_deck(self):
-        """Initialize and shuffle the deck of cards."""
-        self.deck = []
-        for number in range(6, 14):
-            for suit in ['♥️', '♦️', '♣️', '♠️']:
-                label = str(number)
-                if number == 10: label = 'J'
-                elif number == 11: label = 'Q'
-                elif number == 12: label = 'K'
-                elif number == 13: label = 'A'
-                self.deck.append(Card(label, suit))
-        
+        """Initialize and shuffle the deck of cards.
+
+        The deck is stored back-to-front so every draw is an O(1) pop from
+        the end; the trump card sits at index 0 and is drawn last.
+        """
+        self.deck = list(range(36))
         random.shuffle(self.deck)
-        self.trump_card = self.deck[-1]
+        self.deck.reverse()
+        self.trump_card = self.deck[0]
+        self.trump_suit = self.trump_card // 9
 
 class Player:
     def __init__(self, author, player_number):
         self.author = author
         self.number = player_number
+        self._index = None  # position in Server._ordered
         self.channel = None
-        self.hand = []
+        self._worker = None
+        self.hand_mask = 0  # one bit per card int; the whole hand fits in an int
         self.cards_message = None
         self.attacker_message = None
         self.defender_message = None
@@ -207,30 +278,28 @@ class Player:
     
     async def send_error(self, ctx, message):
         """Send an error message to the player, replacing any previous error message."""
-        try:
-            if self.error_message:
-                await self.error_message.delete()
-            self.error_message = await ctx.send(message)
-        except Exception as e:
-            logger.error(f"Failed to send error message: {str(e)}")
+        if self.error_message:
+            await _safe(self.error_message.delete(), "error message delete")
+        self.error_message = await _safe(ctx.send(message), "error message send")
     
     async def send_tip(self, message):
         """Send a tip message to the player, replacing any previous tip message."""
-        try:
-            if self.tip_message:
-                await self.tip_message.delete()
-            self.tip_message = await self.channel.send(message)
-        except Exception as e:
-            logger.error(f"Failed to send tip message: {str(e)}")
+        if self.tip_message:
+            await _safe(self.tip_message.delete(), "tip message delete")
+        self.tip_message = await _safe(self.channel.send(message), "tip message send")
+    
+    def worker(self):
+        """Lazily create the serializing worker for this player's channel."""
+        if self._worker is None:
+            self._worker = ChannelWorker()
+        return self._worker
     
     async def cleanup_messages(self):
         """Clean up temporary messages."""
-        for msg in [self.tip_message, self.error_message]:
-            if msg:
-                try:
-                    await msg.delete()
-                except Exception:
-                    pass
+        await asyncio.gather(
+            *(msg.delete() for msg in (self.tip_message, self.error_message) if msg),
+            return_exceptions=True
+        )
         self.tip_message = None
         self.error_message = None
 
@@ -241,28 +310,56 @@ async def on_ready():
     logger.info(f'Bot is up and running as {client.user}')
     print('Bot is up and running')
 
-@client.event
-async def on_message(message):
-    if message.author == client.user or not message.guild:
+@client.command(name='durak')
+async def durak_setup(ctx):
+    """Set up a new Durak game in this server."""
+    server = app.get_server(ctx.guild)
+    await ctx.message.delete()
+    await ctx.send("Type /join to join the game.")
+    server.close_workers()
+    server.state = GameState.SETUP
+    server.players = {}
+    server._ordered = []
+
+@client.command(name='join')
+async def join(ctx):
+    """Join a Durak game that is being set up."""
+    server = app.get_server(ctx.guild)
+    if server.state != GameState.SETUP:
         return
 
-    server = app.get_server(message.guild)
-
-    if message.content.startswith('/durak'):
-        await message.delete()
-        await message.channel.send("Type /join to join the game.")
-        server.state = GameState.SETUP
-        server.players = {}
+    if ctx.author not in server.players:
+        player = Player(ctx.author, len(server.players) + 1)
+        player._index = len(server._ordered)
+        server.players[ctx.author] = player
+        server._ordered.append(player)
+        await ctx.send(f'{ctx.author.display_name} joined the game.')
+        await ctx.message.delete()
+    else:
+        await ctx.send(f'{ctx.author.display_name} is already in the game.')
+
+async def _setup_player(p, server, ctx, players_list):
+    """Create one player's role, channel and opening messages."""
+    role_name = f'durak {p.number}'
+    role = await ctx.guild.create_role(name=role_name, colour=discord.Colour.random())
+    server._player_role[p.number] = role
+    server.created_roles.append(role)
+    await p.author.add_roles(role)
+
+    channel_name = f'durak-{p.author.display_name}-room'.lower().replace(' ', '-')
+    channel = await ctx.guild.create_text_channel(channel_name)
+    server.created_channels.append(channel)
+    await asyncio.gather(
+        channel.set_permissions(role, send_messages=True, read_messages=True),
+        channel.set_permissions(ctx.guild.default_role, read_messages=False)
+    )
+    p.channel = channel
 
-    elif server.state == GameState.SETUP and message.content.startswith('/join'):
-        if message.author not in server.players:
-            server.players[message.author] = Player(message.author, len(server.players) + 1)
-            await message.channel.send(f'{message.author.display_name} joined the game.')
-            await message.delete()
-        else:
-            await message.channel.send(f'{message.author.display_name} is already in the game.')
+    await channel.send(f'Players in the game: {players_list}')
 
-    await client.process_commands(message)
+    p.cards_message = await channel.send(
+        _HAND_PREFIX + ' '.join(CARD_STR[c] for c in iter_hand(p.hand_mask)) + _CODE_SUFFIX
+    )
 
 @client.command(name='start')
 async def start_game(ctx):
@@ -280,67 +377,49 @@ async def start_game(ctx):
     server.attacker = None
     lowest_trump = None
 
-    # Create player channels and deal cards
-    for player in server.players:
-        # Create role for the player
-        role_name = f'durak {server.players[player].number}'
-        try:
-            role = await ctx.guild.create_role(name=role_name, colour=discord.Colour.random())
-            await player.add_roles(role)
-        except Exception as e:
-            logger.error(f"Error creating role: {str(e)}")
-            await ctx.send("Failed to create roles. Check bot permissions.")
-            return
-        
-        # Create private channel
-        channel_name = f'durak-{player.display_name}-room'.lower().replace(' ', '-')
-        try:
-            channel = await ctx.guild.create_text_channel(channel_name)
-            await channel.set_permissions(role, send_messages=True, read_messages=True)
-            await channel.set_permissions(ctx.guild.default_role, read_messages=False)
-        except Exception as e:
-            logger.error(f"Error creating channel: {str(e)}")
-            await ctx.send("Failed to create channels. Check bot permissions.")
-            return
-        
-        # Set up player
-        p = server.players[player]
-        p.channel = channel
-        p.hand = [server.deck.pop(0) for _ in range(6)]
-        
-        # Check for lowest trump
-        for card in p.hand:
-            if card.suit == server.trump_card.suit:
-                if lowest_trump is None or server.card_ranks[card.rank] < server.card_ranks[lowest_trump]:
-                    lowest_trump = card.rank
+    # Deal cards and find the lowest trump locally; only setup hits the network
+    trump_suit = server.trump_suit
+    for p in server.players.values():
+        p.hand_mask = 0
+        for _ in range(6):
+            card = server.deck.pop()
+            p.hand_mask |= 1 << card
+            if card // 9 == trump_suit:
+                if lowest_trump is None or card % 9 < lowest_trump:
+                    lowest_trump = card % 9
                     server.attacker = p
-        
-        # Send initial messages
-        players_list = ", ".join([player.display_name for player in server.players])
-        await channel.send(f'Players in the game: {players_list}')
-        
-        cards_str = ' '.join([str(card) for card in p.hand])
-        p.cards_message = await channel.send(f'Here are your cards: ```{cards_str}```')
+
+    # Create all roles and channels concurrently
+    players_list = ", ".join([player.display_name for player in server.players])
+    results = await asyncio.gather(
+        *(_setup_player(p, server, ctx, players_list) for p in server.players.values()),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error(f"Error setting up player: {str(result)}")
+            await ctx.send("Failed to create roles or channels. Check bot permissions.")
+            return
 
     # Set initial attacker and defender
     if server.attacker is None:
         server.attacker = list(server.players.values())[0]
 
-    players_by_number = sorted(server.players.values(), key=lambda p: p.number)
-    attacker_index = next(i for i, p in enumerate(players_by_number) if p == server.attacker)
-    defender_index = (attacker_index + 1) % len(players_by_number)
-    server.defender = players_by_number[defender_index]
-
-    # Send game status to all players
-    for player in server.players:
-        p = server.players[player]
-        p.attacker_message = await p.channel.send(
-            f'Attacker: ***{server.attacker.author.display_name}***\n'
-            f'Defender: ***{server.defender.author.display_name}***'
-        )
-        
+    ordered = server._ordered
+    server.defender = ordered[(server.attacker._index + 1) % len(ordered)]
+
+    # Send game status to all players; the header is identical for everyone
+    header = (
+        f'Attacker: ***{server.attacker.author.display_name}***\n'
+        f'Defender: ***{server.defender.author.display_name}***'
+    )
+
+    async def _send_status(p):
+        p.attacker_message = await p.channel.send(header)
         p.table_message = await p.channel.send('Table: ```(empty)\nDeck: loading...```')
 
+    await asyncio.gather(*(_send_status(p) for p in server.players.values()))
+
     await server.update_table()
     
     # Send tip to attacker
@@ -377,16 +456,12 @@ async def play(ctx, *cards):
         return
     
     # Check if all cards have the same value
-    card_objects = []
     try:
-        for card_str in cards:
-            rank = card_str[:-2]
-            suit = card_str[-2:]
-            card_objects.append(Card(rank, suit))
+        card_objects = [STR_TO_CARD[card_str] for card_str in cards]
         
-        first_rank = card_objects[0].rank
+        first_rank = card_objects[0] % 9
         
-        if any(card.rank != first_rank for card in card_objects):
+        if any(card % 9 != first_rank for card in card_objects):
             await player.send_error(ctx, "You can only play cards of the same value.")
             return
         
@@ -394,11 +469,11 @@ async def play(ctx, *cards):
         if server.table:
             allowed_values = set()
             for atk, dfn in server.table:
-                allowed_values.add(atk.rank)
-                if dfn:
-                    allowed_values.add(dfn.rank)
+                allowed_values.add(atk % 9)
+                if dfn is not None:
+                    allowed_values.add(dfn % 9)
             
-            if not all(card.rank in allowed_values for card in card_objects):
+            if not all(card % 9 in allowed_values for card in card_objects):
                 await player.send_error(ctx, 
                     "You can only play cards that match the rank of any card on the table."
                 )
@@ -406,14 +481,15 @@ async def play(ctx, *cards):
         
         # Play the cards
         for card_obj in card_objects:
-            player.hand.remove(card_obj)
+            player.hand_mask &= ~(1 << card_obj)
             server.table.append((card_obj, None))
+        server._undefended_count += len(card_objects)
         
         # Update defender's tip
         await server.defender.send_tip("Type /defend <card(s)> to defend or /take to take the cards.")
         
         # If all cards have been defended, enable /giveup tip
-        if all(d is not None for _, d in server.table):
+        if server._undefended_count == 0:
             await player.send_tip(
                 f'Your turn! Type /play <card(s)> to continue the attack or /giveup to end your attack.'
             )
@@ -450,7 +526,7 @@ async def defend(ctx, *cards):
         return
     
     # Check if all cards are already defended
-    if all(def_card is not None for _, def_card in server.table):
+    if server._undefended_count == 0:
         await player.send_error(ctx, "You already defended all cards.")
         return
     
@@ -473,12 +549,8 @@ async def defend(ctx, *cards):
         return
     
     try:
-        # Convert strings to Card objects
-        card_objects = []
-        for card_str in cards:
-            rank = card_str[:-2]
-            suit = card_str[-2:]
-            card_objects.append(Card(rank, suit))
+        # Convert strings to packed card ints
+        card_objects = [STR_TO_CARD[card_str] for card_str in cards]
         
         # Check if defenses are valid
         valid_defense = True
@@ -498,14 +570,15 @@ async def defend(ctx, *cards):
         for j, i in enumerate(undefended):
             defense_card = card_objects[j]
             server.table[i] = (server.table[i][0], defense_card)
-            player.hand.remove(defense_card)
+            player.hand_mask &= ~(1 << defense_card)
+        server._undefended_count -= len(undefended)
         
         # Update displays
         await server.update_hand(ctx.author)
         await server.update_table()
         
         # If all cards are now defended, update attacker's tip
-        if all(d is not None for _, d in server.table):
+        if server._undefended_count == 0:
             await server.attacker.send_tip(
                 f'Your turn! Type /play <card(s)> to continue the attack or /giveup to end your attack.'
             )
@@ -538,15 +611,15 @@ async def take(ctx):
         return
     
     # Check if all cards are already defended
-    if all(def_card is not None for _, def_card in server.table):
+    if server._undefended_count == 0:
         await player.send_error(ctx, "You already defended all cards. You cannot take now.")
         return
     
     # Take all cards
-    for attack_card, defense_card in server.table:
-        player.hand.append(attack_card)
-        if defense_card:
-            player.hand.append(defense_card)
+    for a, d in server.table:
+        player.hand_mask |= 1 << a
+        if d is not None:
+            player.hand_mask |= 1 << d
     
     # End the turn
     await end_turn(server, turn_taken=True)
@@ -575,7 +648,7 @@ async def giveup(ctx):
         return
     
     # Check if all cards have been defended
-    if any(def_card is None for _, def_card in server.table):
+    if server._undefended_count > 0:
         await player.send_error(ctx, "You can only give up after all your cards have been defended.")
         return
     
@@ -584,36 +657,37 @@ async def giveup(ctx):
 
 async def end_turn(server, turn_taken):
     """End the current turn and set up the next one."""
-    players_by_number = sorted(server.players.values(), key=lambda p: p.number)
-    old_attacker = server.attacker
+    ordered = server._ordered
     old_defender = server.defender
     
     # Clean up messages
-    for p in server.players.values():
-        await p.cleanup_messages()
+    await asyncio.gather(*(p.cleanup_messages() for p in server.players.values()))
     
     # Determine next attacker and defender
     if turn_taken:
         # Defender took cards: attacker = player after defender
-        def_index = next(i for i, p in enumerate(players_by_number) if p == old_defender)
-        start_index = (def_index + 1) % len(players_by_number)
+        start_index = (old_defender._index + 1) % len(ordered)
     else:
         # Attackers gave up: defender becomes attacker
-        start_index = next(i for i, p in enumerate(players_by_number) if p == old_defender)
+        start_index = old_defender._index
     
-    server.attacker = players_by_number[start_index]
-    server.defender = players_by_number[(start_index + 1) % len(players_by_number)]
+    server.attacker = ordered[start_index]
+    server.defender = ordered[(start_index + 1) % len(ordered)]
     server.table = []
+    server._undefended_count = 0
     
-    # Update player messages
-    for p in server.players.values():
-        try:
-            await p.attacker_message.edit(content=
-                f'Attacker: ***{server.attacker.author.display_name}***\n'
-                f'Defender: ***{server.defender.author.display_name}***'
-            )
-        except Exception as e:
-            logger.error(f"Error updating attacker message: {str(e)}")
+    # Update player messages concurrently
+    header = (
+        f'Attacker: ***{server.attacker.author.display_name}***\n'
+        f'Defender: ***{server.defender.author.display_name}***'
+    )
+    results = await asyncio.gather(
+        *(p.attacker_message.edit(content=header) for p in server.players.values()),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error(f"Error updating attacker message: {str(result)}")
     
     # Refill hands
     await server.refill_hands()
@@ -623,39 +697,40 @@ async def end_turn(server, turn_taken):
         durak = list(server.players.values())[0]
         
         # Notify finished players
+        game_over = f"Game over! ***{durak.author.display_name}*** is the Durak!"
         for fin_author in server.finished_players:
-            try:
-                await fin_author.send(f"Game over! ***{durak.author.display_name}*** is the Durak!")
-            except Exception as e:
-                logger.error(f"Error sending game over message: {str(e)}")
+            await _safe(fin_author.send(game_over), "game over message")
         
         # Grant "Ultimate Durak" role
-        try:
-            guild = durak.channel.guild
-            durak_role = discord.utils.get(guild.roles, name="Ultimate Durak")
-            if not durak_role:
-                durak_role = await guild.create_role(name="Ultimate Durak", colour=discord.Colour.dark_red())
-            
-            await durak.author.add_roles(durak_role)
-        except Exception as e:
-            logger.error(f"Error assigning Durak role: {str(e)}")
+        guild = durak.channel.guild
+        durak_role = app.get_ultimate_durak(guild)
+        if not durak_role:
+            durak_role = await _safe(
+                guild.create_role(name="Ultimate Durak", colour=discord.Colour.dark_red()),
+                "create Ultimate Durak role"
+            )
+            if durak_role:
+                app.ultimate_role_ids[guild.id] = durak_role.id
+        if durak_role:
+            await _safe(durak.author.add_roles(durak_role), "grant Ultimate Durak role")
         
+        server.close_workers()
         server.state = GameState.FINISHED
         return
     
-    # Replace trump card if it's taken
-    if server.trump_card and server.trump_card not in server.deck:
-        # Keep only the suit information
-        server.trump_card = Card(server.trump_card.rank, server.trump_card.suit)
+    # Mark the trump as taken once it has left the deck; only its suit shows
+    if server.trump_card is not None and server.trump_card not in server.deck:
         server.trump_taken = True
     
-    # Update all displays
-    for player in server.players:
-        try:
-            await server.update_hand(player)
-        except Exception as e:
-            logger.error(f"Error updating hand: {str(e)}")
-    
+    # Update all displays concurrently
+    results = await asyncio.gather(
+        *(server.update_hand(player) for player in server.players),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error(f"Error updating hand: {str(result)}")
+
     await server.update_table()
     
     # Attacker gets a tip to start turn
@@ -669,25 +744,29 @@ async def delete_all(ctx):
     """Delete all Durak game channels and roles (admin only)."""
     guild = ctx.guild
     
-    # Delete roles
-    roles_to_delete = [role for role in guild.roles if role.name.startswith("durak")]
-    for role in roles_to_delete:
-        try:
-            await role.delete()
-            await ctx.send(f'Deleted role: {role.name}')
-        except Exception as e:
-            logger.error(f"Error deleting role: {str(e)}")
-            await ctx.send(f'Failed to delete role: {role.name}')
-    
-    # Delete channels
-    channels_to_delete = [channel for channel in guild.text_channels if channel.name.startswith("durak")]
-    for channel in channels_to_delete:
-        try:
-            await channel.delete()
-            await ctx.send(f'Deleted channel: {channel.name}')
-        except Exception as e:
-            logger.error(f"Error deleting channel: {str(e)}")
-            await ctx.send(f'Failed to delete channel: {channel.name}')
+    # Delete what we created, concurrently; only fall back to scanning the
+    # guild by name prefix when nothing was tracked (e.g. after a restart)
+    server = app.get_server(guild)
+    targets = server.created_roles + server.created_channels
+    if not targets:
+        targets = [role for role in guild.roles if role.name.startswith("durak")]
+        targets += [channel for channel in guild.text_channels if channel.name.startswith("durak")]
+    results = await asyncio.gather(*(t.delete() for t in targets), return_exceptions=True)
+    server.created_roles = []
+    server.created_channels = []
+
+    deleted, failed = [], []
+    for target, result in zip(targets, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error deleting {target.name}: {str(result)}")
+            failed.append(target.name)
+        else:
+            deleted.append(target.name)
+
+    summary = f"Deleted: {', '.join(deleted) if deleted else '(none)'}"
+    if failed:
+        summary += f"\nFailed: {', '.join(failed)}"
+    await ctx.send(summary)
 
 @client.command(name='help_durak')
 async def help_durak(ctx):
@@ -1,24 +1,85 @@
 import discord
 from discord.ext import commands
+import asyncio
 import random
+import sys
+from collections import deque, namedtuple, OrderedDict
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 token = os.getenv('DISCORD_TOKEN1')
 
-intents = discord.Intents.all()
+# Only the event streams the bot actually consumes; presence/typing/voice
+# would just burn CPU deserializing gateway traffic
+intents = discord.Intents.none()
+intents.guilds = True
+intents.guild_messages = True
+intents.message_content = True
+intents.members = True
 client = commands.Bot(command_prefix='/', intents=intents)
 
+# Cards still index like the old (rank, suit) tuples but carry their display
+# label precomputed and interned plus a packed code: rank in the high bits,
+# suit in the low two, so rules checks are plain bit ops
+Card = namedtuple('Card', ('rank', 'suit', 'label', 'code'))
+
+RANK_INDEX = {'6': 0, '7': 1, '8': 2, '9': 3, 'J': 4, 'Q': 5, 'K': 6, 'A': 7}
+SUIT_INDEX = {'♥️': 0, '♦️': 1, '♣️': 2, '♠️': 3}
+
+RANK_LABELS = ('6', '7', '8', '9', 'J', 'Q', 'K', 'A')
+SUIT_LABELS = ('♥️', '♦️', '♣️', '♠️')
+
+CARD_BY_LABEL = {}
+
+def make_card(rank, suit):
+    label = sys.intern(rank + suit)
+    card = CARD_BY_LABEL.get(label)
+    if card is None:
+        card = Card(rank, suit, label, (RANK_INDEX[rank] << 2) | SUIT_INDEX[suit])
+        CARD_BY_LABEL[label] = card
+    return card
+
+# The same 32 cards make up every deck; build them once at import
+_BASE_DECK = tuple(make_card(rank, suit) for rank in RANK_LABELS for suit in SUIT_LABELS)
+
+def _fire(coro):
+    # Fire-and-forget: don't make the user wait on a DELETE before the
+    # replacement message goes out; the target may already be gone, so
+    # swallow HTTP failures instead of leaving an unretrieved exception
+    async def _run():
+        try:
+            await coro
+        except discord.errors.HTTPException:
+            pass
+    asyncio.create_task(_run())
+
+# Status messages per live game stay well under this; older entries
+# (deleted channels, finished games) age out instead of accumulating
+_SENT_CACHE_MAX = 256
+
 class Application:
     def __init__(self):
         self.servers = {}
+        self._sent_cache = OrderedDict()  # message.id -> payload of the last edit, LRU
 
     def get_server(self, guild):
         if guild.id not in self.servers:
             self.servers[guild.id] = Server(guild.id, guild.name)
         return self.servers[guild.id]
 
+    async def safe_edit(self, message, payload, **kwargs):
+        # Memoize the last payload pushed to each message and skip the REST
+        # call when an edit would be a no-op
+        if self._sent_cache.get(message.id) == payload:
+            self._sent_cache.move_to_end(message.id)
+            return
+        await message.edit(**kwargs)
+        self._sent_cache[message.id] = payload
+        self._sent_cache.move_to_end(message.id)
+        if len(self._sent_cache) > _SENT_CACHE_MAX:
+            self._sent_cache.popitem(last=False)
+
 class Server:
     def __init__(self, id, name):
         self.id = id
@@ -27,46 +88,75 @@ class Server:
         self.game_setup = False
         self.game = False
         self.players = {}
-        self.deck = []
+        self.deck = deque()  # popleft() keeps draws O(1)
         self.trump_card = None
         self.table = []
         self.attacker = None
         self.defender = None
         self.finished_players = set()  # authors who completed the game
-        self.card_ranks = {'6': 0, '7': 1, '8': 2, '9': 3, '10': 4, 'J': 5, 'Q': 6, 'K': 7, 'A': 8}
-
-    async def update_table(self):
-        for player in self.players:
-            content = []
-            for a, d in self.table:
-                if d:
-                    content.append(f"{a[0]}{a[1]}<-{d[0]}{d[1]}")
-                else:
-                    content.append(f"{a[0]}{a[1]}")
-
-            if self.trump_card:
-                trump_str = f"{self.trump_card[1]}" if self.trump_taken else f"{self.trump_card[0]}{self.trump_card[1]}"
+        self._players_by_number = []  # join order, which is also number order
+        self._player_index = {}  # player -> position in _players_by_number
+        self._role_cache = {}  # role name -> role, filled when we create or find one
+        self._channel_cache = {}  # channel name -> channel we created
+        self._trump_suit_idx = None  # SUIT_INDEX of the trump, cached at deal time
+
+    def _shared_status(self):
+        # The table, deck and turn lines are identical for every player
+        content = []
+        for a, d in self.table:
+            if d:
+                content.append(f"{a.label}<-{d.label}")
             else:
-                trump_str = "?"
+                content.append(a.label)
 
-            deck_status = f"Deck: {len(self.deck)} cards | Trump: {trump_str}"
-            table_str = "     ".join(content) if content else "(empty)"
-            await self.players[player].table_message.edit(
-                content=f'Table: ```{table_str}\n{deck_status}```'
-            )
+        if self.trump_card:
+            trump_str = f"{self.trump_card[1]}" if self.trump_taken else f"{self.trump_card[0]}{self.trump_card[1]}"
+        else:
+            trump_str = "?"
 
-    async def update_hand(self, player):
-        cards = ' '.join([f' {card[0]}{card[1]}' for card in self.players[player].hand])
+        deck_status = f"Deck: {len(self.deck)} cards | Trump: {trump_str}"
+        table_str = "     ".join(content) if content else "(empty)"
 
-        await self.players[player].cards_message.edit(content=f'Here are your cards: ```{cards}```')
+        if self.attacker and self.defender:
+            turn_str = (f'Attacker: ***{self.attacker.author.display_name}***\n'
+                        f'Defender: ***{self.defender.author.display_name}***')
+        else:
+            turn_str = "(not started)"
+        return turn_str, f'```{table_str}\n{deck_status}```'
+
+    async def update_status(self, p, shared=None):
+        # One embed per player carries turn, table, hand and tip: a single
+        # PATCH per player per change instead of up to four message edits
+        turn_str, table_block = shared if shared else self._shared_status()
+        hand_block = '```' + ' '.join(card.label for card in p.hand) + '```'
+        tip = p.tip or ''
+
+        serialized = turn_str + table_block + hand_block + tip
+        if app._sent_cache.get(p.status_message.id) == serialized:
+            return
+
+        embed = discord.Embed(title="Durak", colour=discord.Colour.blue())
+        embed.add_field(name="Turn", value=turn_str, inline=False)
+        embed.add_field(name="Table", value=table_block, inline=False)
+        embed.add_field(name="Your hand", value=hand_block, inline=False)
+        if tip:
+            embed.add_field(name="Tip", value=tip, inline=False)
+
+        await app.safe_edit(p.status_message, serialized, embed=embed)
+
+    async def update_all_status(self):
+        shared = self._shared_status()
+        await asyncio.gather(
+            *(self.update_status(p, shared) for p in self.players.values()),
+            return_exceptions=True
+        )
 
     def cards_are_in_hand(self, player, cards):
-        hand_strings = [f"{card[0]}{card[1]}" for card in player.hand]
-        return all(card in hand_strings for card in cards)
+        return all(card in player.hand_set for card in cards)
 
     async def refill_hands(self):
-        players_by_number = sorted(self.players.values(), key=lambda p: p.number)
-        start_index = next(i for i, p in enumerate(players_by_number) if p == self.attacker)
+        players_by_number = self._players_by_number
+        start_index = self._player_index[self.attacker]
 
         for i in range(len(players_by_number)):
             p = players_by_number[(start_index + i) % len(players_by_number)]
@@ -75,44 +165,53 @@ class Server:
                 continue  # already empty, skip draw
 
             while len(p.hand) < 6 and self.deck:
-                drawn = self.deck.pop(0)
+                drawn = self.deck.popleft()
                 if drawn == self.trump_card:
                     self.trump_taken = True
                 p.hand.append(drawn)
+                p.hand_set.add(drawn.label)
 
-            await self.update_hand(p.author)
+        # Eliminate players with 0 cards after refill: one pass over the
+        # dict, then all the per-player cleanup calls fired concurrently
+        eliminated = [p for p in self.players.values() if not p.hand]
 
-        # Eliminate players with 0 cards after refill
-        eliminated = []
-        for p in list(self.players.values()):
-            if len(p.hand) == 0:
+        async def _retire(p):
+            durak_role = self._role_cache.get("Ultimate Durak")
+            if durak_role is None:
                 durak_role = discord.utils.get(p.channel.guild.roles, name="Ultimate Durak")
-                if durak_role in p.author.roles:
-                    await p.author.remove_roles(durak_role)
-
-                eliminated.append(p)
+                if durak_role:
+                    self._role_cache["Ultimate Durak"] = durak_role
+            if durak_role in p.author.roles:
+                await p.author.remove_roles(durak_role)
 
-        for p in eliminated:
-            self.finished_players.add(p.author)
             await p.channel.send("🎉 You have finished all your cards!")
             try:
                 await p.channel.delete()
             except:
                 pass
-            role = discord.utils.get(p.channel.guild.roles, name=f"durak {p.number}")
+            role = self._role_cache.pop(f"durak {p.number}", None)
+            if role is None:
+                role = discord.utils.get(p.channel.guild.roles, name=f"durak {p.number}")
             if role:
                 await role.delete()
-            del self.players[p.author]
+
+        if eliminated:
+            await asyncio.gather(*(_retire(p) for p in eliminated), return_exceptions=True)
+            for p in eliminated:
+                self.finished_players.add(p.author)
+                del self.players[p.author.id]
+                self._players_by_number.remove(p)
+            self._player_index = {q: i for i, q in enumerate(self._players_by_number)}
 
     def is_defence_success(self, attacking_card, defending_card):
-        if attacking_card[1] == self.trump_card[1] and defending_card[1] != self.trump_card[1]:
-            return False
-        elif attacking_card[1] != self.trump_card[1] and defending_card[1] == self.trump_card[1]:
-            return True
-        elif defending_card[1] == attacking_card[1]:
-            return self.card_ranks[attacking_card[0]] < self.card_ranks[defending_card[0]]
-        else:
-            return False
+        ts = self._trump_suit_idx
+        a = attacking_card.code
+        d = defending_card.code
+        a_trump = (a & 3) == ts
+        d_trump = (d & 3) == ts
+        if a_trump != d_trump:
+            return d_trump
+        return (a & 3) == (d & 3) and (d >> 2) > (a >> 2)
 
 
 class Player:
@@ -121,12 +220,10 @@ class Player:
         self.number = player_number
         self.channel = None
         self.hand = []
-        self.cards_message = None
-        self.attacker_message = None
-        self.defender_message = None
-        self.table_message = None
+        self.hand_set = set()  # mirrors hand as labels for O(1) membership
+        self.status_message = None  # single embed: turn, table, hand, tip
+        self.tip = None
         self.error_message = None
-        self.tip_message = None
 
 app = Application()
 
@@ -134,29 +231,32 @@ app = Application()
 async def on_ready():
     print('Bot is up and running')
 
-@client.event
-async def on_message(message):
-    if message.author == client.user or not message.guild:
+@client.command(name='durak')
+async def durak_setup(ctx):
+    server = app.get_server(ctx.guild)
+    await ctx.message.delete()
+    await ctx.send("Type /join to join the game.")
+    server.game_setup = True
+    server.game = False
+    server.players = {}
+    server._players_by_number = []
+    server._player_index = {}
+
+@client.command(name='join')
+async def join(ctx):
+    server = app.get_server(ctx.guild)
+    if not server.game_setup:
         return
 
-    server = app.get_server(message.guild)
-
-    if message.content.startswith('/durak'):
-        await message.delete()
-        await message.channel.send("Type /join to join the game.")
-        server.game_setup = True
-        server.game = False
-        server.players = {}
-
-    elif server.game_setup and message.content.startswith('/join'):
-        if message.author not in server.players:
-            server.players[message.author] = Player(message.author, len(server.players) + 1)
-            await message.channel.send(f'{message.author.display_name} joined the game.')
-            await message.delete()
-        else:
-            await message.channel.send(f'{message.author.display_name} is already in the game.')
-
-    await client.process_commands(message)
+    if ctx.author.id not in server.players:
+        player = Player(ctx.author, len(server.players) + 1)
+        server.players[ctx.author.id] = player
+        server._player_index[player] = len(server._players_by_number)
+        server._players_by_number.append(player)
+        await ctx.send(f'{ctx.author.display_name} joined the game.')
+        await ctx.message.delete()
+    else:
+        await ctx.send(f'{ctx.author.display_name} is already in the game.')
 
 @client.command(name='start')
 async def start_game(ctx):
@@ -168,67 +268,67 @@ async def start_game(ctx):
         return
 
     server.game_setup = False
-    server.deck = []
     server.attacker = None
-    lowest_trump = None
-
-    for number in range(6, 14):
-        for suit in ['♥️', '♦️', '♣️', '♠️']:
-            label = str(number)
-            if number == 10: label = 'J'
-            elif number == 11: label = 'Q'
-            elif number == 12: label = 'K'
-            elif number == 13: label = 'A'
-            server.deck.append((label, suit))
-
-    random.shuffle(server.deck)
-    server.trump_card = server.deck[-1]
-
-    for player in server.players:
-        role_name = f'durak {server.players[player].number}'
-        role = await ctx.guild.create_role(name=role_name, colour=discord.Colour.random())
-        await player.add_roles(role)
 
-        channel_name = f'durak-{player.display_name}-room'.lower().replace(' ', '-')
-        channel = await ctx.guild.create_text_channel(channel_name)
-        await channel.set_permissions(role, send_messages=True, read_messages=True)
-        await channel.set_permissions(ctx.guild.default_role, read_messages=False)
+    # sample() shuffles straight into a fresh list, and dealing by slice
+    # avoids touching the deque until the leftovers are known
+    deck = random.sample(_BASE_DECK, len(_BASE_DECK))
+    server.trump_card = deck[-1]
+    server._trump_suit_idx = server.trump_card.code & 3
 
-        p = server.players[player]
+    # Deal every hand up front; only provisioning needs the network
+    deal_idx = 0
+    for p in server.players.values():
+        p.hand = deck[deal_idx:deal_idx + 6]
+        p.hand_set = {card.label for card in p.hand}
+        deal_idx += 6
+
+    server.deck = deque(deck[deal_idx:])
+
+    players_list = ", ".join([p.author.display_name for p in server.players.values()])
+
+    async def _provision(member, p):
+        role_name = f'durak {p.number}'
+        role = await ctx.guild.create_role(name=role_name, colour=discord.Colour.random())
+        server._role_cache[role_name] = role
+        await member.add_roles(role)
+
+        channel_name = f'durak-{member.display_name}-room'.lower().replace(' ', '-')
+        overwrites = {
+            role: discord.PermissionOverwrite(send_messages=True, read_messages=True),
+            ctx.guild.default_role: discord.PermissionOverwrite(read_messages=False),
+        }
+        channel = await ctx.guild.create_text_channel(channel_name, overwrites=overwrites)
+        server._channel_cache[channel_name] = channel
         p.channel = channel
-        p.hand = [server.deck.pop(0) for _ in range(6)]
 
-        cards = ' '.join([f'{card[0]}{card[1]}' for card in p.hand])
-        await channel.send(f'players in the game: {", ".join([player.display_name for player in server.players])}.')
-        p.cards_message = await channel.send(f'Here are your cards: ```{cards}```')
+        await channel.send(f'players in the game: {players_list}.')
+        p.status_message = await channel.send(
+            embed=discord.Embed(title="Durak", description="Setting up the game...")
+        )
 
-        for card in p.hand:
-            if card[1] == server.trump_card[1]:
-                if lowest_trump is None or server.card_ranks[card[0]] < server.card_ranks[lowest_trump]:
-                    lowest_trump = card[0]
-                    server.attacker = p
+    await asyncio.gather(*(_provision(p.author, p) for p in server.players.values()))
+
+    # Lowest trump decides the first attacker: one flat min-reduction
+    trump_suit = server.trump_card[1]
+    best = min(
+        ((c.code >> 2, p) for p in server.players.values()
+         for c in p.hand if c[1] == trump_suit),
+        key=lambda t: t[0],
+        default=(None, None)
+    )
+    server.attacker = best[1]
 
     if server.attacker is None:
         server.attacker = list(server.players.values())[0]
 
-    players_by_number = sorted(server.players.values(), key=lambda p: p.number)
-    attacker_index = next(i for i, p in enumerate(players_by_number) if p == server.attacker)
+    players_by_number = server._players_by_number
+    attacker_index = server._player_index[server.attacker]
     defender_index = (attacker_index + 1) % len(players_by_number)
     server.defender = players_by_number[defender_index]
 
-    for player in server.players:
-        p = server.players[player]
-        msg = await p.channel.send(
-            f'Attacker: ***{server.attacker.author.display_name}***\n'
-            f'Defender: ***{server.defender.author.display_name}***'
-        )
-        p.attacker_message = msg  # this will be edited later
-
-        p.table_message = await p.channel.send('Table: ```(empty)\nDeck: loading...```')
-
-    await server.update_table()
-
-    server.attacker.tip_message = await server.attacker.channel.send(f'Your turn! Type /play <card(s)> to play, /giveup to end your attack.')
+    server.attacker.tip = 'Your turn! Type /play <card(s)> to play, /giveup to end your attack.'
+    await server.update_all_status()
 
     await ctx.send("Game started, roles and channels created.")
     server.game = True
@@ -245,14 +345,14 @@ async def play(ctx, *cards):
 
     if not server.cards_are_in_hand(server.attacker, cards):
         if server.attacker.error_message:
-            await server.attacker.error_message.delete()
+            _fire(server.attacker.error_message.delete())
         server.attacker.error_message = await ctx.send("You do not have these cards.")
         return
 
     card_value = cards[0][:-2]
     if any(card[:-2] != card_value for card in cards):
         if server.attacker.error_message:
-            await server.attacker.error_message.delete()
+            _fire(server.attacker.error_message.delete())
         server.attacker.error_message = await ctx.send("You can only play cards of the same value.")
         return
 
@@ -261,33 +361,27 @@ async def play(ctx, *cards):
         allowed_values.update(dfn[0] for atk, dfn in server.table if dfn is not None)
         if not all(card[:-2] in allowed_values for card in cards):
             if server.attacker.error_message:
-                await server.attacker.error_message.delete()
+                _fire(server.attacker.error_message.delete())
             server.attacker.error_message = await ctx.send(
                 "You can only play cards that match the rank of any card on the table."
             )
             return
 
     for card in cards:
-        card_tuple = (card[:-2], card[-2:])
+        card_tuple = CARD_BY_LABEL[card]
         server.attacker.hand.remove(card_tuple)
+        server.attacker.hand_set.discard(card_tuple.label)
         server.table.append((card_tuple, None))
 
-    if server.defender.tip_message is not None:
-        await server.defender.tip_message.delete()
-
-    server.defender.tip_message = await server.defender.channel.send(
-        "Type /defend <card(s)> to defend or /take to take the cards.")
+    server.defender.tip = "Type /defend <card(s)> to defend or /take to take the cards."
 
     # If all cards have been defended, enable /giveup tip
     if all(d is not None for _, d in server.table):
-        if server.attacker.tip_message:
-            await server.attacker.tip_message.delete()
-        server.attacker.tip_message = await server.attacker.channel.send(
-            f'Your turn! Type /play <card(s)> to continue the attack or /giveup to end your attack.'
+        server.attacker.tip = (
+            'Your turn! Type /play <card(s)> to continue the attack or /giveup to end your attack.'
         )
 
-    await server.update_hand(ctx.author)
-    await server.update_table()
+    await server.update_all_status()
 
 @client.command(name='defend')
 async def defend(ctx, *cards):
@@ -298,30 +392,30 @@ async def defend(ctx, *cards):
 
     if ctx.author != server.defender.author or ctx.channel != server.defender.channel or not server.table:
         if server.defender.error_message:
-            await server.defender.error_message.delete()
+            _fire(server.defender.error_message.delete())
         server.defender.error_message = await ctx.send("You cannot take at this time.")
         return
 
     if all(def_card is not None for _, def_card in server.table):
         if server.defender.error_message:
-            await server.defender.error_message.delete()
+            _fire(server.defender.error_message.delete())
         server.defender.error_message = await ctx.send("You already defended all cards. You cannot take now.")
         return
 
     if all(def_card is not None for _, def_card in server.table):
         if server.defender.error_message:
-            await server.defender.error_message.delete()
+            _fire(server.defender.error_message.delete())
         server.defender.error_message = await ctx.send("You already defended all cards. You cannot take now.")
         return
 
         if server.defender.error_message:
-            await server.defender.error_message.delete()
+            _fire(server.defender.error_message.delete())
         server.defender.error_message = await ctx.send("You cannot defend at this time.")
         return
 
     if not server.cards_are_in_hand(server.defender, cards):
         if server.defender.error_message:
-            await server.defender.error_message.delete()
+            _fire(server.defender.error_message.delete())
         server.defender.error_message = await ctx.send("You do not have these cards.")
         return
 
@@ -329,69 +423,61 @@ async def defend(ctx, *cards):
 
     if len(cards) != len(undefended):
         if server.defender.error_message:
-            await server.defender.error_message.delete()
+            _fire(server.defender.error_message.delete())
         server.defender.error_message = await ctx.send("You must defend all cards on the table.")
         return
 
-    if not all(server.is_defence_success(server.table[i][0], (cards[j][:-2], cards[j][-2:])) for j, i in enumerate(undefended)):
+    # Validate the whole defence in a tight local loop: the trump suit and
+    # parsed cards are hoisted out, leaving plain int compares per pair
+    ts = server._trump_suit_idx
+    defense_cards = [CARD_BY_LABEL[c] for c in cards]
+    valid = True
+    for j, i in enumerate(undefended):
+        a = server.table[i][0].code
+        d = defense_cards[j].code
+        a_trump = (a & 3) == ts
+        d_trump = (d & 3) == ts
+        if a_trump != d_trump:
+            ok = d_trump
+        else:
+            ok = (a & 3) == (d & 3) and (d >> 2) > (a >> 2)
+        if not ok:
+            valid = False
+            break
+
+    if not valid:
         if server.defender.error_message:
-            await server.defender.error_message.delete()
+            _fire(server.defender.error_message.delete())
         server.defender.error_message = await ctx.send("These cards are not a valid defence.")
         return
 
     for j, i in enumerate(undefended):
-        defense_tuple = (cards[j][:-2], cards[j][-2:])
+        defense_tuple = defense_cards[j]
         server.table[i] = (server.table[i][0], defense_tuple)
         server.defender.hand.remove(defense_tuple)
+        server.defender.hand_set.discard(defense_tuple.label)
 
-    await server.update_hand(ctx.author)
-    await server.update_table()
+    await server.update_all_status()
 
 async def end_turn(server: Server, turn_taken: bool):
-    players_by_number = sorted(server.players.values(), key=lambda p: p.number)
-    old_attacker = server.attacker
+    players_by_number = server._players_by_number
     old_defender = server.defender
 
-    # Clean tip and error messages
+    # Clear tips and drop any standing error messages
+    await asyncio.gather(
+        *(p.error_message.delete() for p in server.players.values() if p.error_message),
+        return_exceptions=True
+    )
     for p in server.players.values():
-        # Delete previous tip/error messages
-        for msg in [p.tip_message, p.error_message]:
-            if msg:
-                await msg.delete()
-        p.tip_message = None
+        p.tip = None
         p.error_message = None
 
-        # Edit attacker message in-place
-        new_attacker = None
-        new_defender = None
-
-        if turn_taken:
-            # Defender took: attacker is next after defender
-            def_index = next(i for i, p in enumerate(players_by_number) if p == server.defender)
-            new_attacker = players_by_number[(def_index + 1) % len(players_by_number)]
-        else:
-            # Attackers gave up: defender becomes attacker
-            new_attacker = server.defender
-
-        new_defender_index = (players_by_number.index(new_attacker) + 1) % len(players_by_number)
-        new_defender = players_by_number[new_defender_index]
-
-        server.attacker = new_attacker
-        server.defender = new_defender
-
-        for p in server.players.values():
-            await p.attacker_message.edit(content=
-                                          f'Attacker: ***{server.attacker.author.display_name}***\n'
-                                          f'Defender: ***{server.defender.author.display_name}***'
-                                          )
-
     if turn_taken:
         # Defender took cards: attacker = player after defender
-        def_index = next(i for i, p in enumerate(players_by_number) if p == old_defender)
-        start_index = (def_index + 1) % len(players_by_number)
+        start_index = (server._player_index[old_defender] + 1) % len(players_by_number)
     else:
         # Attackers gave up: defender becomes attacker
-        start_index = next(i for i, p in enumerate(players_by_number) if p == old_defender)
+        start_index = server._player_index[old_defender]
 
     server.attacker = players_by_number[start_index]
     server.defender = players_by_number[(start_index + 1) % len(players_by_number)]
@@ -410,9 +496,12 @@ async def end_turn(server: Server, turn_taken: bool):
                 pass
         # Grant "Ultimate Durak" role
         guild = durak.channel.guild
-        durak_role = discord.utils.get(guild.roles, name="Ultimate Durak")
+        durak_role = server._role_cache.get("Ultimate Durak")
+        if not durak_role:
+            durak_role = discord.utils.get(guild.roles, name="Ultimate Durak")
         if not durak_role:
             durak_role = await guild.create_role(name="Ultimate Durak", colour=discord.Colour.dark_red())
+        server._role_cache["Ultimate Durak"] = durak_role
 
         await durak.author.add_roles(durak_role)
         return
@@ -421,15 +510,11 @@ async def end_turn(server: Server, turn_taken: bool):
     if server.trump_card and server.trump_card not in server.deck:
         server.trump_card = (server.trump_card[1], '')  # symbol only, no value
 
-    # Update all displays
-    for player in server.players:
-        await server.update_hand(player)
-        await server.update_table()
-
-    # Attacker gets a tip to start turn
-    server.attacker.tip_message = await server.attacker.channel.send(
-        f'Your turn! Type /play <card(s)> to play or /giveup to end your attack.'
+    # Attacker gets a tip to start the turn; one refresh covers everything
+    server.attacker.tip = (
+        'Your turn! Type /play <card(s)> to play or /giveup to end your attack.'
     )
+    await server.update_all_status()
 
 
 @client.command(name='take')
@@ -441,20 +526,22 @@ async def take(ctx):
 
     if ctx.author != server.defender.author or ctx.channel != server.defender.channel or not server.table:
         if server.defender.error_message:
-            await server.defender.error_message.delete()
+            _fire(server.defender.error_message.delete())
         server.defender.error_message = await ctx.send("You cannot take at this time.")
         return
 
     if all(def_card is not None for _, def_card in server.table):
         if server.defender.error_message:
-            await server.defender.error_message.delete()
+            _fire(server.defender.error_message.delete())
         server.defender.error_message = await ctx.send("You already defended all cards. You cannot take now.")
         return
 
     for attack_card, defense_card in server.table:
         server.defender.hand.append(attack_card)
+        server.defender.hand_set.add(attack_card.label)
         if defense_card:
             server.defender.hand.append(defense_card)
+            server.defender.hand_set.add(defense_card.label)
 
     await end_turn(server, turn_taken=True)
 
@@ -470,14 +557,14 @@ async def giveup(ctx):
 
     if not server.table:
         if server.attacker.error_message:
-            await server.attacker.error_message.delete()
+            _fire(server.attacker.error_message.delete())
         server.attacker.error_message = await ctx.send("You must play at least one card before you can give up.")
         return
 
     # Check if all cards have been defended
     if any(def_card is None for _, def_card in server.table):
         if server.attacker.error_message:
-            await server.attacker.error_message.delete()
+            _fire(server.attacker.error_message.delete())
         server.attacker.error_message = await ctx.send("You can only give up after all your cards have been defended.")
         return
 
@@ -1,3 +1,5 @@
+import asyncio
+import bisect
 import discord
 import random
 from typing import Dict, List, Set, Tuple, Optional, Union
@@ -17,16 +19,18 @@ class Card:
         if not isinstance(other, Card):
             return False
         return self.rank == other.rank and self.suit == other.suit
-    
+
+    def __hash__(self) -> int:
+        return hash((self.rank, self.suit))
+
     @classmethod
     def from_string(cls, card_str: str) -> 'Card':
-        """Create a Card object from a string representation."""
-        if len(card_str) < 3:
-            raise ValueError(f"Invalid card string: {card_str}")
-        rank = card_str[:-2]
-        suit = card_str[-2:]
-        return cls(rank, suit)
-    
+        """Look up the canonical interned Card for a string representation."""
+        try:
+            return _CARD_POOL[card_str]
+        except KeyError:
+            raise ValueError(f"Invalid card string: {card_str}") from None
+
     @classmethod
     def create_deck(cls) -> List['Card']:
         """Create a standard deck of cards for Durak."""
@@ -42,6 +46,16 @@ class Card:
         return deck
 
 
+# All 32 distinct cards, interned once so parsing never allocates
+_CARD_POOL: Dict[str, Card] = {str(card): card for card in Card.create_deck()}
+
+_SUIT_ORDER: Dict[str, int] = {suit: i for i, suit in enumerate(CARD_SUITS)}
+
+def hand_sort_key(card: Card) -> Tuple[int, int]:
+    """Sort key keeping hands grouped by suit, then ascending by rank."""
+    return (_SUIT_ORDER[card.suit], CARD_RANKS[card.rank])
+
+
 class Player:
     """Represents a player in the Durak game."""
     
@@ -49,10 +63,9 @@ class Player:
         self.author = author
         self.number = player_number
         self.channel = None
-        self.hand: List[Card] = []
+        self.hand: List[Card] = []  # kept sorted by hand_sort_key
+        self._hand_sig: frozenset = frozenset()  # hand state at the last successful edit
         self.cards_message = None
-        self.attacker_message = None
-        self.defender_message = None
         self.table_message = None
         self.error_message = None
         self.tip_message = None
@@ -95,32 +108,70 @@ class Server:
         self.name = name
         self.trump_taken = False
         self.state = GameState.SETUP
-        self.players: Dict[discord.Member, Player] = {}
+        self.players: Dict[int, Player] = {}  # keyed by the author's int user id
         self.deck: List[Card] = []
         self.trump_card: Optional[Card] = None
         self.table: List[Tuple[Card, Optional[Card]]] = []
+        self._table_ranks: Set[str] = set()  # ranks currently on the table
         self.attacker: Optional[Player] = None
         self.defender: Optional[Player] = None
         self.finished_players: Set[discord.Member] = set()  # authors who completed the game
-    
+        self.durak_role_id: Optional[int] = None  # cached "Ultimate Durak" role id
+        self._order: List[Player] = []  # players sorted by number; numbers only grow
+        self._attacker_idx: int = 0
+
     def get_player(self, author: discord.Member) -> Optional[Player]:
         """Get a player by their Discord member object."""
-        return self.players.get(author)
-    
+        return self.players.get(author.id)
+
     def add_player(self, author: discord.Member) -> Player:
         """Add a new player to the game."""
-        if author in self.players:
-            return self.players[author]
-        
+        if author.id in self.players:
+            return self.players[author.id]
+
         player = Player(author, len(self.players) + 1)
-        self.players[author] = player
+        self.players[author.id] = player
+        self._order.append(player)  # numbers are assigned in join order, so this stays sorted
         return player
+
+    def remove_player(self, player: Player) -> None:
+        """Remove a player from the game, keeping the turn order consistent."""
+        idx = self._order.index(player)
+        self._order.pop(idx)
+        if idx < self._attacker_idx:
+            self._attacker_idx -= 1
+        self._attacker_idx = self._attacker_idx % len(self._order) if self._order else 0
+        del self.players[player.author.id]
+
+    def reset_players(self) -> None:
+        """Clear all players ahead of a new game setup."""
+        self.players = {}
+        self._order = []
+        self._attacker_idx = 0
     
     def cards_are_in_hand(self, player: Player, card_strings: List[str]) -> bool:
         """Check if all specified cards are in the player's hand."""
-        hand_strings = [str(card) for card in player.hand]
-        return all(card in hand_strings for card in card_strings)
+        try:
+            wanted = {Card.from_string(card) for card in card_strings}
+        except ValueError:
+            return False
+        return wanted.issubset(player.hand)
     
+    def _push_attack(self, card: Card) -> None:
+        """Add an attacking card to the table, tracking its rank."""
+        self.table.append((card, None))
+        self._table_ranks.add(card.rank)
+
+    def _push_defense(self, index: int, card: Card) -> None:
+        """Defend the attack in the given table slot, tracking the rank."""
+        self.table[index] = (self.table[index][0], card)
+        self._table_ranks.add(card.rank)
+
+    def clear_table(self) -> None:
+        """Remove all cards from the table."""
+        self.table = []
+        self._table_ranks.clear()
+
     def is_defence_success(self, attacking_card: Card, defending_card: Card) -> bool:
         """Determine if a defense is successful according to Durak rules."""
         if attacking_card.suit == self.trump_card.suit and defending_card.suit != self.trump_card.suit:
@@ -133,67 +184,89 @@ class Server:
             return False
     
     async def update_table(self) -> None:
-        """Update the table display for all players."""
-        for player in self.players:
-            content = []
-            for a, d in self.table:
-                if d:
-                    content.append(f"{a}<-{d}")
-                else:
-                    content.append(f"{a}")
-            
-            if self.trump_card:
-                trump_str = f"{self.trump_card.suit}" if self.trump_taken else f"{self.trump_card}"
+        """Update the table display, including the turn header, for all players."""
+        content = []
+        for a, d in self.table:
+            if d:
+                content.append(f"{a}<-{d}")
             else:
-                trump_str = "?"
-            
-            deck_status = f"Deck: {len(self.deck)} cards | Trump: {trump_str}"
-            table_str = "     ".join(content) if content else "(empty)"
-            
-            try:
-                await self.players[player].table_message.edit(
-                    content=f'Table: ```{table_str}\n{deck_status}```'
-                )
-            except discord.errors.HTTPException as e:
-                logger.error(f"Failed to update table: {str(e)}")
+                content.append(f"{a}")
+
+        if self.trump_card:
+            trump_str = f"{self.trump_card.suit}" if self.trump_taken else f"{self.trump_card}"
+        else:
+            trump_str = "?"
+
+        deck_status = f"Deck: {len(self.deck)} cards | Trump: {trump_str}"
+        table_str = "     ".join(content) if content else "(empty)"
+
+        header = ''
+        if self.attacker and self.defender:
+            header = (
+                f'Attacker: ***{self.attacker.author.display_name}***\n'
+                f'Defender: ***{self.defender.author.display_name}***\n'
+            )
+
+        full = f'{header}Table: ```{table_str}\n{deck_status}```'
+
+        results = await asyncio.gather(
+            *(p.table_message.edit(content=full) for p in self.players.values()),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Failed to update table: {str(result)}")
     
-    async def update_hand(self, player: discord.Member) -> None:
-        """Update the hand display for a specific player."""
-        cards = ' '.join([f' {card}' for card in self.players[player].hand])
-        
+    async def update_hand(self, p: Player) -> None:
+        """Update the hand display for a specific player, skipping no-op edits."""
+
+        # Hands hold distinct cards, so a frozenset captures the full state
+        sig = frozenset(p.hand)
+        if sig == p._hand_sig:
+            return
+
+        cards = ' '.join([f' {card}' for card in p.hand])
+
         try:
-            await self.players[player].cards_message.edit(
+            await p.cards_message.edit(
                 content=f'Here are your cards: ```{cards}```'
             )
+            p._hand_sig = sig
         except discord.errors.HTTPException as e:
             logger.error(f"Failed to update hand: {str(e)}")
     
     async def refill_hands(self) -> None:
         """Refill all players' hands to 6 cards if possible."""
-        players_by_number = sorted(self.players.values(), key=lambda p: p.number)
-        start_index = next((i for i, p in enumerate(players_by_number) if p == self.attacker), 0)
-        
-        # Refill hands
+        players_by_number = self._order
+        start_index = self._attacker_idx
+
+        # Refill hands locally first (pure Python, no awaits), then push all
+        # the edits at once; the update_hand dirty-bit skips untouched hands
         for i in range(len(players_by_number)):
             p = players_by_number[(start_index + i) % len(players_by_number)]
-            
+
             if len(p.hand) == 0:
                 continue  # already empty, skip draw
-            
+
             while len(p.hand) < 6 and self.deck:
-                drawn = self.deck.pop(0)
+                drawn = self.deck.pop()
                 if drawn == self.trump_card:
                     self.trump_taken = True
-                p.hand.append(drawn)
-            
-            await self.update_hand(p.author)
-        
+                bisect.insort(p.hand, drawn, key=hand_sort_key)
+
+        await asyncio.gather(*(self.update_hand(p) for p in players_by_number))
+
         # Eliminate players with 0 cards after refill
         eliminated = []
         for p in list(self.players.values()):
             if len(p.hand) == 0:
                 try:
-                    durak_role = discord.utils.get(p.channel.guild.roles, name="Ultimate Durak")
+                    guild = p.channel.guild
+                    durak_role = guild.get_role(self.durak_role_id) if self.durak_role_id else None
+                    if durak_role is None:
+                        durak_role = discord.utils.get(guild.roles, name="Ultimate Durak")
+                        if durak_role:
+                            self.durak_role_id = durak_role.id
                     if durak_role in p.author.roles:
                         await p.author.remove_roles(durak_role)
                 except discord.errors.Forbidden:
@@ -221,24 +294,32 @@ class Server:
                 logger.warning(f"No permission to delete role for {p.author.display_name}")
             except Exception as e:
                 logger.error(f"Error deleting role: {str(e)}")
-            
-            del self.players[p.author]
+
+            self.remove_player(p)
     
     def initialize_deck(self) -> None:
-        """Initialize and shuffle the deck of cards."""
+        """Initialize and shuffle the deck of cards.
+
+        The deck is stored back-to-front so draws are O(1) pops from the
+        end of the list; the trump card sits at index 0 and is drawn last.
+        """
         self.deck = Card.create_deck()
         random.shuffle(self.deck)
-        self.trump_card = self.deck[-1]
+        self.deck.reverse()
+        self.trump_card = self.deck[0]
 
 
 class Application:
     """Main application class that manages all server instances."""
-    
+
     def __init__(self):
+        # Keyed by the guild's int snowflake so lookups never go through
+        # discord.Guild equality/hashing
         self.servers: Dict[int, Server] = {}
-    
+
     def get_server(self, guild: discord.Guild) -> Server:
         """Get or create a Server instance for a Discord guild."""
-        if guild.id not in self.servers:
-            self.servers[guild.id] = Server(guild.id, guild.name)
-        return self.servers[guild.id]
\ No newline at end of file
+        server = self.servers.get(guild.id)
+        if server is None:
+            server = self.servers[guild.id] = Server(guild.id, guild.name)
+        return server
\ No newline at end of file
@@ -3,7 +3,9 @@ from discord.ext import commands
 import random
 import os
 import asyncio
+import bisect
 import logging
+from collections import deque
 from enum import Enum
 from typing import Dict, List, Set, Tuple, Optional
 from dotenv import load_dotenv
@@ -53,6 +55,10 @@ class Card:
             '♣️': '♧'   # Clubs
         }
         self.suit = suit_map.get(suit, suit)
+        self.rank_int = CARD_RANK_INT[rank]
+        # Packed key: rank in the high bits, suit in the low two, so a
+        # single int compare orders cards by strength
+        self._key = (self.rank_int << 2) | SUIT_INDEX[suit]
     
     def __str__(self):
         return f"{self.rank}{self.suit}"
@@ -61,17 +67,43 @@ class Card:
         if not isinstance(other, Card):
             return False
         return self.rank == other.rank and self.original_suit == other.original_suit
+    
+    def __hash__(self):
+        return hash((self.rank, self.original_suit))
+
+# Rank and suit orders shared by sorting and rules checks
+CARD_RANK_INT = {'6': 0, '7': 1, '8': 2, '9': 3, '10': 4, 'J': 5, 'Q': 6, 'K': 7, 'A': 8}
+SUIT_INDEX = {'♥️': 0, '♦️': 1, '♣️': 2, '♠️': 3}
+
+# Hands are kept sorted by suit then rank so selection displays never re-sort
+_SORT_KEY = lambda c: (c.original_suit, c.rank_int)
+
+# The deck composition never changes, so build the 36 cards once at
+# import and copy the template per game. The old range(6, 14) loop also
+# stopped one short of the ace row; the explicit label list restores it.
+_RANK_LABELS = ['6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
+_SUITS = ('♥️', '♦️', '♣️', '♠️')
+_DECK_TEMPLATE = [Card(rank, suit) for rank in _RANK_LABELS for suit in _SUITS]
 
 # Set up Discord bot
 intents = discord.Intents.all()
 client = commands.Bot(command_prefix='/', intents=intents)
 
+# Suit iteration order and display symbols for hand rendering
+_SUIT_ORDER = ("♥️", "♦️", "♣️", "♠️")
+_SUIT_DISPLAY = {"♥️": "♡", "♦️": "♢", "♣️": "♧", "♠️": "♤"}
+
+# Cards shown per selection page
+CARDS_PER_PAGE = 10
+
 # Emoji numbers for card selection
 NUMBER_EMOJIS = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
+_EMOJI_TO_INDEX = {e: i for i, e in enumerate(NUMBER_EMOJIS)}
 CONFIRM_EMOJI = "✅"
 CANCEL_EMOJI = "❌"
 PLAY_EMOJI = "🃏"
 DEFEND_EMOJI = "🛡️"
+
 TAKE_EMOJI = "🤲"
 GIVEUP_EMOJI = "🏳️"
 NEXT_PAGE_EMOJI = "⏩"
@@ -79,9 +111,67 @@ PREV_PAGE_EMOJI = "⏪"
 JOIN_EMOJI = "👤"
 START_EMOJI = "🎮"
 
+async def safe_delete_message(message):
+    """Delete a message, tolerating it already being gone."""
+    if not message:
+        return
+    try:
+        await message.delete()
+    except discord.errors.NotFound:
+        pass
+    except discord.errors.HTTPException as e:
+        logger.error(f"Error deleting message: {str(e)}")
+
+
+class SetupView(discord.ui.View):
+    """Join/Start buttons for the setup message.
+    
+    A button click is delivered as one interaction — no add_reaction
+    seeding and no remove_reaction round-trip per press like the old
+    reaction-based setup flow.
+    """
+    
+    def __init__(self, server):
+        super().__init__(timeout=None)
+        self.server = server
+    
+    @discord.ui.button(emoji=JOIN_EMOJI, label="Join", style=discord.ButtonStyle.primary)
+    async def join_button(self, interaction, button):
+        server = self.server
+        if server.state != GameState.SETUP:
+            await interaction.response.defer()
+            return
+        
+        user = interaction.user
+        if user.id not in server.players:
+            server.players[user.id] = Player(user, len(server.players) + 1)
+            server.rebuild_player_order()
+            await interaction.response.defer()
+            await server.update_setup_message()
+        else:
+            await interaction.response.send_message(
+                f'{user.display_name} is already in the game.', ephemeral=True
+            )
+    
+    @discord.ui.button(emoji=START_EMOJI, label="Start", style=discord.ButtonStyle.success)
+    async def start_button(self, interaction, button):
+        server = self.server
+        if server.state != GameState.SETUP:
+            await interaction.response.defer()
+            return
+        
+        if len(server.players) < 2:
+            await interaction.response.send_message(
+                "Need at least 2 players to start the game.", ephemeral=True
+            )
+        else:
+            await interaction.response.defer()
+            await start_game_internal(server, interaction.channel)
+
 class Application:
     def __init__(self):
         self.servers = {}
+        self.durak_role_ids = {}  # guild id -> "Ultimate Durak" role id
 
     def get_server(self, guild):
         if guild.id not in self.servers:
@@ -89,92 +179,171 @@ class Application:
         return self.servers[guild.id]
 
 class Server:
+    # Instruction blocks are static; join them once at class definition
+    _INSTRUCTIONS_SINGLE = "\n".join([
+        "Select cards by clicking number reactions",
+        f"Click {CONFIRM_EMOJI} to confirm your selection",
+        f"Click {CANCEL_EMOJI} to cancel",
+    ])
+    _INSTRUCTIONS_PAGED = "\n".join([
+        _INSTRUCTIONS_SINGLE,
+        f"Use {PREV_PAGE_EMOJI} and {NEXT_PAGE_EMOJI} to navigate pages",
+    ])
+    
     def __init__(self, id, name):
         self.id = id
         self.name = name
         self.trump_taken = False
         self.state = GameState.SETUP
-        self.players = {}
+        self.players = {}  # Keyed by the author's int user id
         self.deck = []
         self.trump_card = None
-        self.table = []
+        self._trump_suit = None  # Cached trump suit, set when the deck is built
+        self.table_attackers = []  # Attack cards, parallel to table_defenders
+        self.table_defenders = []  # Defence per slot, None while undefended
+        self._allowed_ranks = set()  # Ranks on the table, kept incrementally
+        self.players_by_number = []  # Players sorted by number, kept in sync
+        self.player_index = {}  # Player -> position in players_by_number
         self.attacker = None
         self.defender = None
-        self.finished_players = set()  # authors who completed the game
-        self.card_ranks = {'6': 0, '7': 1, '8': 2, '9': 3, '10': 4, 'J': 5, 'Q': 6, 'K': 7, 'A': 8}
-        self.active_selection_messages = {}  # Track active selection messages
+        self.finished_players = set()  # user ids of players who completed the game
+        self.role_cache = {}  # Role name -> Role, filled as roles are created or found
         self.setup_message = None  # Message for game setup with reactions
         self.setup_channel = None  # Channel where setup is happening
+        self.api_queue = asyncio.Queue()  # Fire-and-forget Discord calls
+        self.work_q = asyncio.Queue(maxsize=128)  # Pending reaction jobs
+        self._reaction_workers = []  # Fixed pool draining work_q, started lazily
+        self.dropped_events = 0  # Jobs rejected because the queue was full
+        self._api_consumer = None  # Task draining api_queue, started lazily
+
+    def rebuild_player_order(self):
+        """Recompute the cached turn order after players join or leave."""
+        self.players_by_number = sorted(self.players.values(), key=lambda p: p.number)
+        self.player_index = {p: i for i, p in enumerate(self.players_by_number)}
+
+    def submit_reaction(self, job):
+        """Queue a reaction job for the worker pool so the gateway callback
+        returns immediately; drops the event when the queue is saturated."""
+        try:
+            self.work_q.put_nowait(job)
+        except asyncio.QueueFull:
+            self.dropped_events += 1
+            logger.warning("Reaction work queue full; dropping event")
+            return
+        if len(self._reaction_workers) < 4:
+            self._reaction_workers.append(asyncio.create_task(self._reaction_worker()))
+
+    async def _reaction_worker(self):
+        """Run queued reaction jobs; one slow API call no longer stalls
+        every other player's events."""
+        while True:
+            job = await self.work_q.get()
+            try:
+                await job()
+            except Exception as e:
+                logger.error(f"Reaction worker error: {str(e)}")
+
+    def enqueue_api_call(self, factory):
+        """Queue a side-effect Discord call so the event handler can return.
+        
+        factory is a zero-argument callable returning a fresh coroutine, so
+        the consumer can retry a rate-limited call with a new coroutine.
+        """
+        self.api_queue.put_nowait(factory)
+        if self._api_consumer is None or self._api_consumer.done():
+            self._api_consumer = asyncio.create_task(self._drain_api_queue())
+
+    async def _drain_api_queue(self):
+        """Drain queued API calls, backing off when Discord rate-limits."""
+        while True:
+            factory = await self.api_queue.get()
+            try:
+                await factory()
+            except discord.HTTPException as e:
+                if e.status == 429:
+                    await asyncio.sleep(getattr(e, 'retry_after', None) or 1)
+                    try:
+                        await factory()
+                    except Exception as retry_error:
+                        logger.error(f"Queued API call failed after retry: {str(retry_error)}")
+                else:
+                    logger.error(f"Queued API call failed: {str(e)}")
+            except Exception as e:
+                logger.error(f"Queued API call failed: {str(e)}")
 
     async def update_table(self):
         """Update the table display for all players."""
-        for player in self.players.values():
-            embed = discord.Embed(title="Game Table", color=discord.Color.gold())
-            
-            # Add table cards
-            table_str = ""
-            for a, d in self.table:
-                if d:
-                    table_str += f"{a} ← {d}  "
-                else:
-                    table_str += f"{a} ❓  "
-            
-            embed.add_field(
-                name="Cards on Table", 
-                value=table_str if table_str else "(empty)", 
-                inline=False
-            )
-            
-            # Add deck and trump info
-            if self.trump_card:
-                trump_str = f"{self.trump_card.suit}" if self.trump_taken else f"{self.trump_card}"
+        # The embed is identical for every player, so build it once and
+        # fan the edits out concurrently
+        embed = discord.Embed(title="Game Table", color=discord.Color.gold())
+        
+        # Add table cards
+        table_str = ""
+        for a, d in zip(self.table_attackers, self.table_defenders):
+            if d:
+                table_str += f"{a} ← {d}  "
             else:
-                trump_str = "?"
-                
-            embed.add_field(
-                name="Game Info", 
-                value=f"Deck: {len(self.deck)} cards | Trump: {trump_str}", 
-                inline=False
-            )
-            
-            # Add turn info
-            embed.add_field(
-                name="Turn", 
-                value=f"Attacker: {self.attacker.author.display_name}\nDefender: {self.defender.author.display_name}", 
-                inline=False
-            )
+                table_str += f"{a} ❓  "
+        
+        embed.add_field(
+            name="Cards on Table", 
+            value=table_str if table_str else "(empty)", 
+            inline=False
+        )
+        
+        # Add deck and trump info
+        if self.trump_card:
+            trump_str = f"{self.trump_card.suit}" if self.trump_taken else f"{self.trump_card}"
+        else:
+            trump_str = "?"
             
-            try:
-                if player.table_message:
-                    await player.table_message.edit(embed=embed)
-                else:
-                    player.table_message = await player.channel.send(embed=embed)
-            except Exception as e:
-                logger.error(f"Failed to update table: {str(e)}")
+        embed.add_field(
+            name="Game Info", 
+            value=f"Deck: {len(self.deck)} cards | Trump: {trump_str}", 
+            inline=False
+        )
+        
+        # Add turn info
+        embed.add_field(
+            name="Turn", 
+            value=f"Attacker: {self.attacker.author.display_name}\nDefender: {self.defender.author.display_name}", 
+            inline=False
+        )
+        
+        async def _push(player):
+            if player.table_message:
+                await player.table_message.edit(embed=embed)
+            else:
+                player.table_message = await player.channel.send(embed=embed)
+        
+        results = await asyncio.gather(
+            *(_push(player) for player in self.players.values()),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Failed to update table: {str(result)}")
 
     async def update_hand(self, player):
         """Update the hand display for a specific player."""
+        # Unchanged hand: no embed rebuild, no edit call
+        hand_hash = hash(tuple(player.hand))
+        if player.cards_message and hand_hash == player._last_hand_hash:
+            return
+        
         embed = discord.Embed(title="Your Cards", color=discord.Color.blue())
         
         if player.hand:
-            # Group cards by suit for better organization
-            suits = {"♥️": [], "♦️": [], "♣️": [], "♠️": []}
+            # Group cards by suit; the hand is already sorted, so each
+            # bucket comes out in rank order without another sort
+            buckets = {suit: [] for suit in _SUIT_ORDER}
             for card in player.hand:
-                suits[card.original_suit].append(card)
+                buckets[card.original_suit].append(card)
             
-            # Create a compact display of all cards
-            all_cards = []
-            # Use the alternative suit symbols for display
-            suit_display = {"♥️": "♡", "♦️": "♢", "♣️": "♧", "♠️": "♤"}
-            
-            for suit in ["♥️", "♦️", "♣️", "♠️"]:
-                cards = suits[suit]
-                if cards:
-                    sorted_cards = sorted(cards, key=lambda c: self.card_ranks[c.rank])
-                    cards_str = " ".join([str(card) for card in sorted_cards])
-                    all_cards.append(f"{suit_display[suit]}: {cards_str}")
-            
-            embed.description = "\n".join(all_cards)
+            embed.description = "\n".join(
+                f"{_SUIT_DISPLAY[suit]}: {' '.join(map(str, buckets[suit]))}"
+                for suit in _SUIT_ORDER if buckets[suit]
+            )
             
             # Add total count
             embed.set_footer(text=f"Total: {len(player.hand)} cards")
@@ -186,17 +355,18 @@ class Server:
                 await player.cards_message.edit(embed=embed)
             else:
                 player.cards_message = await player.channel.send(embed=embed)
+            player._last_hand_hash = hand_hash
         except Exception as e:
             logger.error(f"Failed to update hand: {str(e)}")
 
     def cards_are_in_hand(self, player, cards):
         """Check if all specified cards are in the player's hand."""
-        return all(card in player.hand for card in cards)
+        return set(cards).issubset(player._hand_set)
 
     async def refill_hands(self):
         """Refill all players' hands to 6 cards if possible."""
-        players_by_number = sorted(self.players.values(), key=lambda p: p.number)
-        start_index = next((i for i, p in enumerate(players_by_number) if p == self.attacker), 0)
+        players_by_number = self.players_by_number
+        start_index = self.player_index.get(self.attacker, 0)
         
         for i in range(len(players_by_number)):
             p = players_by_number[(start_index + i) % len(players_by_number)]
@@ -205,10 +375,10 @@ class Server:
                 continue  # already empty, skip draw
             
             while len(p.hand) < 6 and self.deck:
-                drawn = self.deck.pop(0)
+                drawn = self.deck.popleft()
                 if drawn == self.trump_card:
                     self.trump_taken = True
-                p.hand.append(drawn)
+                p.add_card(drawn)
             
             await self.update_hand(p)
         
@@ -217,7 +387,11 @@ class Server:
         for p in list(self.players.values()):
             if len(p.hand) == 0:
                 try:
-                    durak_role = discord.utils.get(p.channel.guild.roles, name="Ultimate Durak")
+                    durak_role = self.role_cache.get("Ultimate Durak")
+                    if durak_role is None:
+                        durak_role = discord.utils.get(p.channel.guild.roles, name="Ultimate Durak")
+                        if durak_role:
+                            self.role_cache["Ultimate Durak"] = durak_role
                     if durak_role in p.author.roles:
                         await p.author.remove_roles(durak_role)
                 except Exception as e:
@@ -226,7 +400,7 @@ class Server:
                 eliminated.append(p)
         
         for p in eliminated:
-            self.finished_players.add(p.author)
+            self.finished_players.add(p.author.id)
             try:
                 await p.channel.send("🎉 You have finished all your cards!")
                 await p.channel.delete()
@@ -234,53 +408,48 @@ class Server:
                 logger.error(f"Error with channel operations: {str(e)}")
             
             try:
-                role = discord.utils.get(p.channel.guild.roles, name=f"durak {p.number}")
+                role = self.role_cache.pop(f"durak {p.number}", None)
+                if role is None:
+                    role = discord.utils.get(p.channel.guild.roles, name=f"durak {p.number}")
                 if role:
                     await role.delete()
             except Exception as e:
                 logger.error(f"Error deleting role: {str(e)}")
             
-            del self.players[p.author]
+            del self.players[p.author.id]
+        
+        if eliminated:
+            self.rebuild_player_order()
 
     def is_defence_success(self, attacking_card, defending_card):
         """Determine if a defense is successful according to Durak rules."""
-        if attacking_card.original_suit == self.trump_card.original_suit and defending_card.original_suit != self.trump_card.original_suit:
-            return False
-        elif attacking_card.original_suit != self.trump_card.original_suit and defending_card.original_suit == self.trump_card.original_suit:
-            return True
-        elif defending_card.original_suit == attacking_card.original_suit:
-            return self.card_ranks[attacking_card.rank] < self.card_ranks[defending_card.rank]
-        else:
-            return False
+        # Template cards are shared between servers, so trump-ness is a
+        # comparison against this server's cached trump suit rather than
+        # a flag stamped onto the card itself
+        trump_suit = self._trump_suit
+        attacker_is_trump = attacking_card.original_suit == trump_suit
+        defender_is_trump = defending_card.original_suit == trump_suit
+        if attacker_is_trump != defender_is_trump:
+            return defender_is_trump
+        return (attacking_card.original_suit == defending_card.original_suit
+                and attacking_card.rank_int < defending_card.rank_int)
 
     def initialize_deck(self):
         """Initialize and shuffle the deck of cards."""
-        self.deck = []
-        for number in range(6, 14):
-            for suit in ['♥️', '♦️', '♣️', '♠️']:
-                if number == 6: label = '6'
-                elif number == 7: label = '7'
-                elif number == 8: label = '8'
-                elif number == 9: label = '9'
-                elif number == 10: label = '10'
-                elif number == 11: label = 'J'
-                elif number == 12: label = 'Q'
-                elif number == 13: label = 'K'
-                elif number == 14: label = 'A'
-                else: label = str(number)  # Fallback
-                self.deck.append(Card(label, suit))
-        
-        random.shuffle(self.deck)
+        deck = list(_DECK_TEMPLATE)
+        random.shuffle(deck)
+        self.deck = deque(deck)  # popleft() keeps every draw O(1)
         self.trump_card = self.deck[-1]
+        self._trump_suit = self.trump_card.original_suit
 
     async def display_action_menu(self, player, is_attacker=True):
         """Display action menu with reaction buttons."""
-        # Clear any existing action menu
-        if player.action_menu:
-            try:
-                await player.action_menu.delete()
-            except:
-                pass
+        # The menu content is fully determined by the role and whether the
+        # attack can be ended; an unchanged menu needs no API calls at all
+        giveup_available = bool(self.table_attackers) and None not in self.table_defenders
+        menu_sig = (is_attacker, giveup_available)
+        if player.action_menu and player.menu_sig == menu_sig:
+            return
         
         embed = discord.Embed(
             title="Your Turn", 
@@ -292,34 +461,49 @@ class Server:
             embed.add_field(name=f"{PLAY_EMOJI} Play Card(s)", value="Select cards to attack", inline=True)
             
             # Only show give up if there are cards on the table and all are defended
-            if self.table and all(d is not None for _, d in self.table):
+            if giveup_available:
                 embed.add_field(name=f"{GIVEUP_EMOJI} End Attack", value="Pass turn to next player", inline=True)
+            emojis = [PLAY_EMOJI] + ([GIVEUP_EMOJI] if giveup_available else [])
         else:
             embed.add_field(name=f"{DEFEND_EMOJI} Defend", value="Select cards to defend with", inline=True)
             embed.add_field(name=f"{TAKE_EMOJI} Take Cards", value="Take all cards from the table", inline=True)
+            emojis = [DEFEND_EMOJI, TAKE_EMOJI]
         
-        player.action_menu = await player.channel.send(embed=embed)
+        # Edit the existing menu in place rather than delete + resend
+        if player.action_menu:
+            try:
+                await player.action_menu.edit(embed=embed)
+            except Exception as e:
+                logger.error(f"Failed to edit action menu: {str(e)}")
+                player.action_menu = None
+        if player.action_menu is None:
+            player.action_menu = await player.channel.send(embed=embed)
+            player.menu_reactions = set()
         
-        # Add reactions
-        if is_attacker:
-            await player.action_menu.add_reaction(PLAY_EMOJI)
-            if self.table and all(d is not None for _, d in self.table):
-                await player.action_menu.add_reaction(GIVEUP_EMOJI)
-        else:
-            await player.action_menu.add_reaction(DEFEND_EMOJI)
-            await player.action_menu.add_reaction(TAKE_EMOJI)
+        # Only touch the reactions that actually changed
+        desired = set(emojis)
+        to_add = desired - player.menu_reactions
+        to_remove = player.menu_reactions - desired
+        if to_add or to_remove:
+            await asyncio.gather(
+                *(player.action_menu.add_reaction(e) for e in to_add),
+                *(player.action_menu.remove_reaction(e, client.user) for e in to_remove),
+                return_exceptions=True
+            )
+        player.menu_reactions = desired
+        player.menu_sig = menu_sig
 
     async def display_card_selection(self, player, action_type, undefended_indices=None):
         """Display cards with number reactions for selection."""
         # Clear any existing selection message
-        if player.author in self.active_selection_messages:
-            try:
-                await self.active_selection_messages[player.author].delete()
-            except:
-                pass
+        if player.selection_message:
+            await safe_delete_message(player.selection_message)
+            player.selection_message = None
         
-        # Reset pagination
+        # Reset pagination and the cached embed; the defend field and
+        # instructions can differ between sessions
         player.selection_page = 0
+        player.selection_embed = None
         
         # Create and display the selection message
         await self.update_card_selection_display(player, action_type, undefended_indices)
@@ -334,23 +518,25 @@ class Server:
             
     async def update_card_selection_display(self, player, action_type=None, undefended_indices=None, update_reactions=False):
         """Update the card selection display with pagination."""
-        # Sort the hand by suit and rank
-        sorted_hand = sorted(player.hand, key=lambda card: (card.original_suit, self.card_ranks[card.rank]))
+        # The hand is kept sorted by suit and rank on insert
+        sorted_hand = player.hand
         
-        # Store the mapping between sorted indices and original hand
-        player.sorted_to_hand_map = {i: sorted_hand[i] for i in range(len(sorted_hand))}
+        # Nothing visible changed since the last render: skip the embed
+        # rebuild and the edit round-trip entirely
+        snapshot = (player.selection_page, tuple(player.selected_cards), len(sorted_hand))
+        if (player.selection_message and not update_reactions
+                and snapshot == player._last_selection_snapshot):
+            return
+        
+        # Store the mapping between display indices and hand cards
+        player.sorted_to_hand_map = dict(enumerate(sorted_hand))
         
         # Calculate pagination
-        cards_per_page = 10
-        total_pages = (len(sorted_hand) + cards_per_page - 1) // cards_per_page
-        start_idx = player.selection_page * cards_per_page
-        end_idx = min(start_idx + cards_per_page, len(sorted_hand))
+        total_pages = player.total_pages
+        start_idx = player.selection_page * CARDS_PER_PAGE
+        end_idx = min(start_idx + CARDS_PER_PAGE, len(sorted_hand))
         
-        embed = discord.Embed(
-            title="Select Card(s)", 
-            description=f"Click the number reactions to select cards, then click ✅ to confirm (Page {player.selection_page + 1}/{max(1, total_pages)}):",
-            color=discord.Color.blue()
-        )
+        description = f"Click the number reactions to select cards, then click ✅ to confirm (Page {player.selection_page + 1}/{total_pages}):"
         
         # Display cards with numbers in a compact format
         cards_display = []
@@ -370,52 +556,50 @@ class Server:
         for i in range(0, len(cards_display), 5):
             rows.append("  ".join(cards_display[i:i+5]))
         
-        # Show selected cards from all pages
-        if player.selected_cards:
-            selected_str = ", ".join([str(card) for card in player.selected_cards])
-            embed.add_field(
-                name="Selected Cards",
-                value=selected_str,
-                inline=False
-            )
-        
-        embed.add_field(
-            name="Select Card(s)",
-            value="\n".join(rows) if rows else "(No cards on this page)",
-            inline=False
-        )
+        # Only two fields change within a selection session, so the embed
+        # is built once and mutated in place afterwards. The field layout
+        # is fixed: 0 = Selected Cards, 1 = Select Card(s), then the
+        # optional defend field and the instructions
+        selected_value = (", ".join(str(card) for card in player.selected_cards)
+                          if player.selected_cards else "(none)")
+        select_value = "\n".join(rows) if rows else "(No cards on this page)"
         
-        # For defense, show which cards need defending
-        if action_type == "defend" and undefended_indices:
-            undefended_cards = [self.table[i][0] for i in undefended_indices]
-            undefended_str = ", ".join([str(card) for card in undefended_cards])
+        embed = player.selection_embed
+        if embed is None or not player.selection_message:
+            embed = discord.Embed(
+                title="Select Card(s)", 
+                description=description,
+                color=discord.Color.blue()
+            )
+            embed.add_field(name="Selected Cards", value=selected_value, inline=False)
+            embed.add_field(name="Select Card(s)", value=select_value, inline=False)
+            
+            # For defense, show which cards need defending
+            if action_type == "defend" and undefended_indices:
+                undefended_cards = [self.table_attackers[i] for i in undefended_indices]
+                undefended_str = ", ".join([str(card) for card in undefended_cards])
+                embed.add_field(
+                    name="Cards to Defend Against:",
+                    value=undefended_str,
+                    inline=False
+                )
+            
+            # Add instructions with pagination info if needed
             embed.add_field(
-                name="Cards to Defend Against:",
-                value=undefended_str,
+                name="Instructions",
+                value=self._INSTRUCTIONS_PAGED if total_pages > 1 else self._INSTRUCTIONS_SINGLE,
                 inline=False
             )
-        
-        # Add instructions with pagination info if needed
-        instructions = [
-            f"Select cards by clicking number reactions",
-            f"Click {CONFIRM_EMOJI} to confirm your selection",
-            f"Click {CANCEL_EMOJI} to cancel"
-        ]
-        
-        if total_pages > 1:
-            instructions.append(f"Use {PREV_PAGE_EMOJI} and {NEXT_PAGE_EMOJI} to navigate pages")
-        
-        embed.add_field(
-            name="Instructions",
-            value="\n".join(instructions),
-            inline=False
-        )
+            player.selection_embed = embed
+        else:
+            embed.description = description
+            embed.set_field_at(0, name="Selected Cards", value=selected_value, inline=False)
+            embed.set_field_at(1, name="Select Card(s)", value=select_value, inline=False)
         
         # Create a new message or update existing one
         if not player.selection_message:
             # First time creating the message - create it and add all reactions
             player.selection_message = await player.channel.send(embed=embed)
-            self.active_selection_messages[player.author] = player.selection_message
             
             # Add all necessary reactions
             await self.add_selection_reactions(player, total_pages, end_idx - start_idx)
@@ -427,39 +611,62 @@ class Server:
                 logger.error(f"Failed to update selection message: {str(e)}")
                 # If editing fails, create a new message with reactions
                 player.selection_message = await player.channel.send(embed=embed)
-                self.active_selection_messages[player.author] = player.selection_message
                 await self.add_selection_reactions(player, total_pages, end_idx - start_idx)
         
-        # Only update reactions if explicitly requested (page change)
+        player._last_selection_snapshot = snapshot
+        player._rendered_page = player.selection_page
+        
+        # Only update reactions if explicitly requested (page change).
+        # Diff against what is already on the message: the number emojis
+        # are usually stable across pages, so only the arrows change
         if update_reactions:
             try:
-                await player.selection_message.clear_reactions()
-                await self.add_selection_reactions(player, total_pages, end_idx - start_idx)
+                desired = set(self._selection_emojis(player, total_pages, end_idx - start_idx))
+                current = player.current_reactions
+                to_add = desired - current
+                to_remove = current - desired
+                if to_add or to_remove:
+                    await asyncio.gather(
+                        *(player.selection_message.add_reaction(e) for e in to_add),
+                        *(player.selection_message.remove_reaction(e, client.user) for e in to_remove),
+                        return_exceptions=True
+                    )
+                player.current_reactions = desired
             except Exception as e:
                 logger.error(f"Failed to update reactions: {str(e)}")
     
-    async def add_selection_reactions(self, player, total_pages, visible_cards):
-        """Add all necessary reactions to a selection message."""
-        # Add number reactions for visible cards
-        for i in range(min(visible_cards, 10)):
-            await player.selection_message.add_reaction(NUMBER_EMOJIS[i])
+    def _selection_emojis(self, player, total_pages, visible_cards):
+        """Build the emoji list a selection message should carry."""
+        emojis = [NUMBER_EMOJIS[i] for i in range(min(visible_cards, 10))]
         
-        # Add pagination reactions if needed
+        # Pagination reactions if needed
         if total_pages > 1:
             if player.selection_page > 0:
-                await player.selection_message.add_reaction(PREV_PAGE_EMOJI)
+                emojis.append(PREV_PAGE_EMOJI)
             if player.selection_page < total_pages - 1:
-                await player.selection_message.add_reaction(NEXT_PAGE_EMOJI)
+                emojis.append(NEXT_PAGE_EMOJI)
+        
+        emojis.append(CONFIRM_EMOJI)
+        emojis.append(CANCEL_EMOJI)
+        return emojis
+    
+    async def add_selection_reactions(self, player, total_pages, visible_cards):
+        """Add all necessary reactions to a selection message."""
+        # Fire the adds concurrently so they overlap instead of
+        # serializing round-trips
+        emojis = self._selection_emojis(player, total_pages, visible_cards)
         
-        # Add confirm/cancel reactions
-        await player.selection_message.add_reaction(CONFIRM_EMOJI)
-        await player.selection_message.add_reaction(CANCEL_EMOJI)
+        await asyncio.gather(
+            *(player.selection_message.add_reaction(e) for e in emojis),
+            return_exceptions=True
+        )
+        player.current_reactions = set(emojis)
         
     async def update_setup_message(self):
         """Update the game setup message with current players and status."""
         embed = discord.Embed(
             title="Durak Game Setup", 
-            description="React to join or start the game:",
+            description="Use the buttons to join or start the game:",
             color=discord.Color.gold()
         )
         
@@ -474,30 +681,27 @@ class Server:
         else:
             embed.add_field(
                 name="Players (0)",
-                value="No players yet. Click 👤 to join!",
+                value="No players yet. Press 👤 Join to enter!",
                 inline=False
             )
         
         # Add instructions
         embed.add_field(
             name="How to Join",
-            value=f"Click {JOIN_EMOJI} to join the game\nClick {START_EMOJI} to start the game (need at least 2 players)",
+            value=f"Press {JOIN_EMOJI} Join to enter the game\nPress {START_EMOJI} Start to begin (need at least 2 players)",
             inline=False
         )
         
-        # Update or create the setup message
+        # Update or create the setup message; the buttons ride along on the
+        # same message, so a fresh send is still a single API call
         if self.setup_message:
             try:
                 await self.setup_message.edit(embed=embed)
             except Exception as e:
                 logger.error(f"Failed to update setup message: {str(e)}")
-                self.setup_message = await self.setup_channel.send(embed=embed)
-                await self.setup_message.add_reaction(JOIN_EMOJI)
-                await self.setup_message.add_reaction(START_EMOJI)
+                self.setup_message = await self.setup_channel.send(embed=embed, view=SetupView(self))
         else:
-            self.setup_message = await self.setup_channel.send(embed=embed)
-            await self.setup_message.add_reaction(JOIN_EMOJI)
-            await self.setup_message.add_reaction(START_EMOJI)
+            self.setup_message = await self.setup_channel.send(embed=embed, view=SetupView(self))
 
 class Player:
     def __init__(self, author, player_number):
@@ -505,8 +709,11 @@ class Player:
         self.number = player_number
         self.channel = None
         self.hand = []
+        self._hand_set = set()  # shadows hand for O(1) membership checks
         self.cards_message = None
         self.action_menu = None
+        self.menu_sig = None  # (is_attacker, giveup_available) last rendered
+        self.menu_reactions = set()  # Emojis currently on the action menu
         self.table_message = None
         self.error_message = None
         self.tip_message = None
@@ -517,13 +724,59 @@ class Player:
         self.selection_action = None
         self.undefended_indices = None
         self.selection_page = 0  # For pagination of card selection
+        self.current_reactions = set()  # Emojis currently on the selection message
         self.sorted_to_hand_map = {}  # Maps sorted indices to hand cards
+        self.lock = asyncio.Lock()  # Serializes this player's reaction handling
+        self.selection_embed = None  # Cached embed mutated in place between edits
+        self._last_selection_snapshot = None  # (page, selected, hand size) last rendered
+        self._rendered_page = None  # Page shown by the last render, for coalescing flips
+        self._last_hand_hash = None  # Hand state at the last successful edit
+        self._error_delete_task = None  # Pending auto-delete of the error message
+        self._notification_delete_task = None  # Pending auto-delete of the notification
+        self._total_pages_cache = None  # (hand size, pages) from the last lookup
+    
+    @property
+    def total_pages(self):
+        """Number of selection pages for the current hand, at least 1.
+
+        Cached against the hand size so page-flip handlers don't redo the
+        arithmetic; hands only change size through draws and plays.
+        """
+        size = len(self.hand)
+        if self._total_pages_cache is None or self._total_pages_cache[0] != size:
+            pages = max(1, (size + CARDS_PER_PAGE - 1) // CARDS_PER_PAGE)
+            self._total_pages_cache = (size, pages)
+        return self._total_pages_cache[1]
+    
+    def add_card(self, card):
+        """Add a card to the hand, keeping it sorted and the set in sync."""
+        bisect.insort(self.hand, card, key=_SORT_KEY)
+        self._hand_set.add(card)
+    
+    def remove_card(self, card):
+        """Remove a card from the hand, keeping the shadow set in sync."""
+        self.hand.remove(card)
+        self._hand_set.discard(card)
+    
+    def remove_cards(self, cards):
+        """Remove several cards in one linear pass over the hand."""
+        chosen = set(map(id, cards))
+        self.hand = [c for c in self.hand if id(c) not in chosen]
+        self._hand_set.difference_update(cards)
+    
+    async def _delete_after(self, message, delay, attr):
+        """Delete a message after a delay, clearing the slot that owns it."""
+        await asyncio.sleep(delay)
+        await safe_delete_message(message)
+        if getattr(self, attr) is message:
+            setattr(self, attr, None)
     
     async def send_error(self, message):
         """Send an error message to the player, replacing any previous error message."""
         try:
-            if self.error_message:
-                await self.error_message.delete()
+            if self._error_delete_task:
+                self._error_delete_task.cancel()
+            await safe_delete_message(self.error_message)
             
             embed = discord.Embed(
                 title="Error", 
@@ -532,10 +785,10 @@ class Player:
             )
             self.error_message = await self.channel.send(embed=embed)
             
-            # Auto-delete after 5 seconds
-            await asyncio.sleep(5)
-            await self.error_message.delete()
-            self.error_message = None
+            # Auto-delete after 5 seconds without holding up the caller
+            self._error_delete_task = asyncio.create_task(
+                self._delete_after(self.error_message, 5, 'error_message')
+            )
         except Exception as e:
             logger.error(f"Failed to send error message: {str(e)}")
     
@@ -557,8 +810,9 @@ class Player:
     async def send_notification(self, title, message, color=discord.Color.blue()):
         """Send a notification message, replacing any previous notification."""
         try:
-            if self.notification_message:
-                await self.notification_message.delete()
+            if self._notification_delete_task:
+                self._notification_delete_task.cancel()
+            await safe_delete_message(self.notification_message)
             
             embed = discord.Embed(
                 title=title, 
@@ -567,25 +821,29 @@ class Player:
             )
             self.notification_message = await self.channel.send(embed=embed)
             
-            # Auto-delete after 5 seconds
-            await asyncio.sleep(5)
-            if self.notification_message:
-                await self.notification_message.delete()
-                self.notification_message = None
+            # Auto-delete after 5 seconds without holding up the caller
+            self._notification_delete_task = asyncio.create_task(
+                self._delete_after(self.notification_message, 5, 'notification_message')
+            )
         except Exception as e:
             logger.error(f"Failed to send notification: {str(e)}")
     
     async def cleanup_messages(self):
         """Clean up temporary messages."""
-        for msg in [self.tip_message, self.error_message, self.action_menu, self.notification_message]:
-            if msg:
-                try:
-                    await msg.delete()
-                except Exception:
-                    pass
+        msgs = [m for m in (self.tip_message, self.error_message,
+                            self.action_menu, self.notification_message) if m]
+        if msgs:
+            try:
+                # One bulk-delete round-trip; falls back to gathered
+                # individual deletes (e.g. messages older than 14 days)
+                await self.channel.delete_messages(msgs)
+            except discord.HTTPException:
+                await asyncio.gather(*(m.delete() for m in msgs), return_exceptions=True)
         self.tip_message = None
         self.error_message = None
         self.action_menu = None
+        self.menu_sig = None
+        self.menu_reactions = set()
         self.notification_message = None
 
 app = Application()
@@ -607,6 +865,7 @@ async def on_message(message):
         # Reset game state
         server.state = GameState.SETUP
         server.players = {}
+        server.rebuild_player_order()
         server.setup_channel = message.channel
         
         # Create reaction-based setup message
@@ -616,8 +875,9 @@ async def on_message(message):
 
     # Keep the command processing for backward compatibility
     elif server.state == GameState.SETUP and message.content.startswith('/join'):
-        if message.author not in server.players:
-            server.players[message.author] = Player(message.author, len(server.players) + 1)
+        if message.author.id not in server.players:
+            server.players[message.author.id] = Player(message.author, len(server.players) + 1)
+            server.rebuild_player_order()
             await message.delete()
             # Update the setup message with the new player
             if server.setup_message:
@@ -638,208 +898,175 @@ async def on_reaction_add(reaction, user):
         return
     
     server = app.get_server(reaction.message.guild)
+    emoji = str(reaction.emoji)  # stringify once instead of per comparison
     
-    # Check if this is a reaction to the setup message
-    if server.setup_message and reaction.message.id == server.setup_message.id:
-        # Remove the reaction
-        try:
-            await reaction.remove(user)
-        except:
-            pass
-        
-        # Handle setup reactions
-        if str(reaction.emoji) == JOIN_EMOJI and server.state == GameState.SETUP:
-            # Join the game
-            if user not in server.players:
-                server.players[user] = Player(user, len(server.players) + 1)
-                await server.update_setup_message()
-            else:
-                # User already joined
-                temp_msg = await server.setup_channel.send(f'{user.display_name} is already in the game.')
-                await asyncio.sleep(3)
-                await temp_msg.delete()
-        
-        elif str(reaction.emoji) == START_EMOJI and server.state == GameState.SETUP:
-            # Start the game if enough players
-            if len(server.players) < 2:
-                temp_msg = await server.setup_channel.send("Need at least 2 players to start the game.")
-                await asyncio.sleep(3)
-                await temp_msg.delete()
-            else:
-                # Start the game
-                await start_game_internal(server, reaction.message.channel)
-        
-        return  # Don't process other reactions for setup message
+    # Setup join/start is handled by the SetupView buttons now
     
     # Check if user is in a game
-    if user not in server.players:
+    if user.id not in server.players:
         return
     
-    player = server.players[user]
+    player = server.players[user.id]
     
-    # Check if this is a reaction to the action menu
-    if player.action_menu and reaction.message.id == player.action_menu.id:
-        # Remove the reaction
-        try:
-            await reaction.remove(user)
-        except:
-            pass
+    # Coalesce rapid page flips: record the requested page immediately,
+    # then render at most once per acquired lock with the latest page, so
+    # N quick presses cost one edit instead of N
+    if (player.selection_message and reaction.message.id == player.selection_message.id
+            and player.action_state == ActionState.SELECTING_CARDS
+            and emoji in (NEXT_PAGE_EMOJI, PREV_PAGE_EMOJI)):
+        server.enqueue_api_call(lambda: reaction.remove(user))
+        total_pages = player.total_pages
+        if emoji == NEXT_PAGE_EMOJI and player.selection_page < total_pages - 1:
+            player.selection_page += 1
+        elif emoji == PREV_PAGE_EMOJI and player.selection_page > 0:
+            player.selection_page -= 1
+        else:
+            return
+        async def _render():
+            async with player.lock:
+                if player._rendered_page != player.selection_page:
+                    await server.update_card_selection_display(
+                        player, player.selection_action, player.undefended_indices,
+                        update_reactions=True
+                    )
+        
+        server.submit_reaction(_render)
+        return
+    
+    # The handler body runs on the worker pool: the gateway callback only
+    # does the cheap lookups above and returns immediately. The per-player
+    # lock still serializes each player's bodies so the await points
+    # between a check and its mutation can't interleave
+    async def _dispatch():
+        async with player.lock:
+            # Check if this is a reaction to the action menu
+            if player.action_menu and reaction.message.id == player.action_menu.id:
+                # Remove the reaction off the handler's critical path
+                server.enqueue_api_call(lambda: reaction.remove(user))
         
-        # Handle action menu reactions
-        if str(reaction.emoji) == PLAY_EMOJI and server.attacker == player:
-            # Start card selection for attack
-            await server.display_card_selection(player, "play")
+                # Handle action menu reactions
+                if emoji == PLAY_EMOJI and server.attacker == player:
+                    # Start card selection for attack
+                    await server.display_card_selection(player, "play")
             
-        elif str(reaction.emoji) == DEFEND_EMOJI and server.defender == player:
-            # Get undefended cards
-            undefended = [i for i, (_, d) in enumerate(server.table) if d is None]
-            if not undefended:
-                await player.send_error("There are no cards to defend against.")
-                return
+                elif emoji == DEFEND_EMOJI and server.defender == player:
+                    # Get undefended cards
+                    undefended = [i for i, d in enumerate(server.table_defenders) if d is None]
+                    if not undefended:
+                        await player.send_error("There are no cards to defend against.")
+                        return
             
-            # Start card selection for defense
-            await server.display_card_selection(player, "defend", undefended)
+                    # Start card selection for defense
+                    await server.display_card_selection(player, "defend", undefended)
             
-        elif str(reaction.emoji) == TAKE_EMOJI and server.defender == player:
-            # Take all cards
-            await take_cards(server)
+                elif emoji == TAKE_EMOJI and server.defender == player:
+                    # Take all cards
+                    await take_cards(server)
             
-        elif str(reaction.emoji) == GIVEUP_EMOJI and server.attacker == player:
-            # Check if all cards are defended
-            if not server.table:
-                await player.send_error("You must play at least one card before you can end your attack.")
-                return
+                elif emoji == GIVEUP_EMOJI and server.attacker == player:
+                    # Check if all cards are defended
+                    if not server.table_attackers:
+                        await player.send_error("You must play at least one card before you can end your attack.")
+                        return
                 
-            if any(d is None for _, d in server.table):
-                await player.send_error("You can only end your attack after all your cards have been defended.")
-                return
+                    if None in server.table_defenders:
+                        await player.send_error("You can only end your attack after all your cards have been defended.")
+                        return
                 
-            # End the turn
-            await end_turn(server, turn_taken=False)
-    
-    # Check if this is a reaction to a card selection message
-    elif player.selection_message and reaction.message.id == player.selection_message.id:
-        # Handle card selection reactions
-        if player.action_state == ActionState.SELECTING_CARDS:
-            # Remove the reaction
-            try:
-                await reaction.remove(user)
-            except:
-                pass
+                    # End the turn
+                    await end_turn(server, turn_taken=False)
+    
+            # Check if this is a reaction to a card selection message
+            elif player.selection_message and reaction.message.id == player.selection_message.id:
+                # Handle card selection reactions
+                if player.action_state == ActionState.SELECTING_CARDS:
+                    # Remove the reaction off the handler's critical path
+                    server.enqueue_api_call(lambda: reaction.remove(user))
             
-            if str(reaction.emoji) in NUMBER_EMOJIS:
-                # Get the card index relative to the current page
-                relative_index = NUMBER_EMOJIS.index(str(reaction.emoji))
-                cards_per_page = 10
-                absolute_index = player.selection_page * cards_per_page + relative_index
+                    relative_index = _EMOJI_TO_INDEX.get(emoji)
+                    if relative_index is not None:
+                        # Get the card index relative to the current page
+                        absolute_index = player.selection_page * CARDS_PER_PAGE + relative_index
                 
-                # Check if the index is valid
-                if absolute_index in player.sorted_to_hand_map:
-                    # Toggle card selection
-                    card = player.sorted_to_hand_map[absolute_index]
+                        # Check if the index is valid
+                        if absolute_index in player.sorted_to_hand_map:
+                            # Toggle card selection
+                            card = player.sorted_to_hand_map[absolute_index]
                     
-                    if card in player.selected_cards:
-                        player.selected_cards.remove(card)
-                    else:
-                        player.selected_cards.append(card)
+                            if card in player.selected_cards:
+                                player.selected_cards.remove(card)
+                            else:
+                                player.selected_cards.append(card)
                     
-                    # Update the selection message
-                    await server.update_card_selection_display(player, player.selection_action, player.undefended_indices)
+                            # Update the selection message
+                            await server.update_card_selection_display(player, player.selection_action, player.undefended_indices)
             
-            elif str(reaction.emoji) == NEXT_PAGE_EMOJI:
-                # Calculate total pages
-                cards_per_page = 10
-                total_pages = (len(player.hand) + cards_per_page - 1) // cards_per_page
+                    elif emoji == CONFIRM_EMOJI:
+                        # Process the selected cards
+                        if not player.selected_cards:
+                            await player.send_error("You must select at least one card.")
+                            return
                 
-                # Move to next page if possible
-                if player.selection_page < total_pages - 1:
-                    player.selection_page += 1
-                    # Update reactions when changing pages
-                    await server.update_card_selection_display(player, player.selection_action, player.undefended_indices, update_reactions=True)
-            
-            elif str(reaction.emoji) == PREV_PAGE_EMOJI:
-                # Move to previous page if possible
-                if player.selection_page > 0:
-                    player.selection_page -= 1
-                    # Update reactions when changing pages
-                    await server.update_card_selection_display(player, player.selection_action, player.undefended_indices, update_reactions=True)
-            
-            elif str(reaction.emoji) == CONFIRM_EMOJI:
-                # Process the selected cards
-                if not player.selected_cards:
-                    await player.send_error("You must select at least one card.")
-                    return
+                        if player.selection_action == "play":
+                            await process_play_cards(server, player)
+                        elif player.selection_action == "defend":
+                            await process_defend_cards(server, player)
                 
-                if player.selection_action == "play":
-                    await process_play_cards(server, player)
-                elif player.selection_action == "defend":
-                    await process_defend_cards(server, player)
-                
-                # Clean up
-                try:
-                    await player.selection_message.delete()
-                except:
-                    pass
-                player.selection_message = None
-                player.action_state = ActionState.IDLE
+                        # Clean up
+                        await safe_delete_message(player.selection_message)
+                        player.selection_message = None
+                        player.action_state = ActionState.IDLE
                 
-                if player.author in server.active_selection_messages:
-                    del server.active_selection_messages[player.author]
             
-            elif str(reaction.emoji) == CANCEL_EMOJI:
-                # Cancel selection
-                try:
-                    await player.selection_message.delete()
-                except:
-                    pass
-                player.selection_message = None
-                player.selected_cards = []
-                player.action_state = ActionState.IDLE
+                    elif emoji == CANCEL_EMOJI:
+                        # Cancel selection
+                        await safe_delete_message(player.selection_message)
+                        player.selection_message = None
+                        player.selected_cards = []
+                        player.action_state = ActionState.IDLE
                 
-                if player.author in server.active_selection_messages:
-                    del server.active_selection_messages[player.author]
                 
-                # Show action menu again
-                await server.display_action_menu(player, server.attacker == player)
+                        # Show action menu again
+                        await server.display_action_menu(player, server.attacker == player)
+    server.submit_reaction(_dispatch)
 
 # This function has been replaced by Server.update_card_selection_display
 
 async def process_play_cards(server, player):
     """Process the selected cards for playing."""
-    # Check if all cards have the same rank
-    if len(set(card.rank for card in player.selected_cards)) > 1:
+    # Check if all cards have the same rank, bailing on the first mismatch
+    first_rank = player.selected_cards[0].rank
+    if any(card.rank != first_rank for card in player.selected_cards[1:]):
         await player.send_error("You can only play cards of the same rank.")
         return
     
-    # Check if cards match values on the table
-    if server.table:
-        allowed_values = set()
-        for atk, dfn in server.table:
-            allowed_values.add(atk.rank)
-            if dfn:
-                allowed_values.add(dfn.rank)
-        
-        if not all(card.rank in allowed_values for card in player.selected_cards):
+    # Check if cards match values on the table; the rank set is maintained
+    # incrementally as cards land on the table
+    if server.table_attackers:
+        if not all(card.rank in server._allowed_ranks for card in player.selected_cards):
             await player.send_error(
                 "You can only play cards that match the rank of any card on the table."
             )
             return
     
-    # Play the cards
+    # Play the cards: one sweep over the hand instead of a remove per card
+    player.remove_cards(player.selected_cards)
     for card in player.selected_cards:
-        player.hand.remove(card)
-        server.table.append((card, None))
+        server.table_attackers.append(card)
+        server.table_defenders.append(None)
+        server._allowed_ranks.add(card.rank)
     
-    # Update displays
-    await server.update_hand(player)
-    await server.update_table()
-    
-    # Update defender's action menu
-    await server.display_action_menu(server.defender, is_attacker=False)
-    
-    # If all cards have been defended, enable give up option for attacker
-    if all(d is not None for _, d in server.table):
-        await server.display_action_menu(server.attacker, is_attacker=True)
+    # Push all UI updates at once; the action menu no-ops when its
+    # button set is unchanged
+    updates = [
+        server.update_hand(player),
+        server.update_table(),
+        server.display_action_menu(server.defender, is_attacker=False),
+    ]
+    if None not in server.table_defenders:
+        # Fully defended: the attacker gains the give-up option
+        updates.append(server.display_action_menu(server.attacker, is_attacker=True))
+    await asyncio.gather(*updates)
     
     # Clear selected cards
     player.selected_cards = []
@@ -856,7 +1083,7 @@ async def process_defend_cards(server, player):
     # Check if defenses are valid
     valid_defense = True
     for i, card_index in enumerate(undefended):
-        attack_card = server.table[card_index][0]
+        attack_card = server.table_attackers[card_index]
         defense_card = player.selected_cards[i]
         
         if not server.is_defence_success(attack_card, defense_card):
@@ -867,19 +1094,18 @@ async def process_defend_cards(server, player):
         await player.send_error("These cards are not a valid defence.")
         return
     
-    # Apply the defense
+    # Apply the defense: one sweep over the hand instead of a remove per card
+    player.remove_cards(player.selected_cards)
     for i, card_index in enumerate(undefended):
-        defense_card = player.selected_cards[i]
-        server.table[card_index] = (server.table[card_index][0], defense_card)
-        player.hand.remove(defense_card)
-    
-    # Update displays
-    await server.update_hand(player)
-    await server.update_table()
+        server.table_defenders[card_index] = player.selected_cards[i]
+        server._allowed_ranks.add(player.selected_cards[i].rank)
     
-    # If all cards are now defended, update attacker's action menu
-    if all(d is not None for _, d in server.table):
-        await server.display_action_menu(server.attacker, is_attacker=True)
+    # Push all UI updates at once
+    updates = [server.update_hand(player), server.update_table()]
+    if None not in server.table_defenders:
+        # Fully defended: the attacker gains the give-up option
+        updates.append(server.display_action_menu(server.attacker, is_attacker=True))
+    await asyncio.gather(*updates)
     
     # Clear selected cards
     player.selected_cards = []
@@ -890,67 +1116,79 @@ async def take_cards(server):
     player = server.defender
     
     # Check if there are cards to take
-    if not server.table:
+    if not server.table_attackers:
         await player.send_error("There are no cards to take.")
         return
     
     # Check if all cards are already defended
-    if all(def_card is not None for _, def_card in server.table):
+    if None not in server.table_defenders:
         await player.send_error("You already defended all cards. You cannot take now.")
         return
     
     # Take all cards
-    for attack_card, defense_card in server.table:
-        player.hand.append(attack_card)
+    for attack_card, defense_card in zip(server.table_attackers, server.table_defenders):
+        player.add_card(attack_card)
         if defense_card:
-            player.hand.append(defense_card)
+            player.add_card(defense_card)
     
     # End the turn
     await end_turn(server, turn_taken=True)
 
 async def end_turn(server, turn_taken):
     """End the current turn and set up the next one."""
-    players_by_number = sorted(server.players.values(), key=lambda p: p.number)
+    players_by_number = server.players_by_number
     old_attacker = server.attacker
     old_defender = server.defender
     
-    # Clean up messages
-    for p in server.players.values():
-        await p.cleanup_messages()
+    # Clean up messages: each player's cleanup is one bulk-delete, and
+    # the players are independent, so run them all concurrently
+    await asyncio.gather(
+        *(p.cleanup_messages() for p in server.players.values()),
+        return_exceptions=True
+    )
     
     # Determine next attacker and defender
     if turn_taken:
         # Defender took cards: attacker = player after defender
-        def_index = next(i for i, p in enumerate(players_by_number) if p == old_defender)
+        def_index = server.player_index[old_defender]
         start_index = (def_index + 1) % len(players_by_number)
     else:
         # Attackers gave up: defender becomes attacker
-        start_index = next(i for i, p in enumerate(players_by_number) if p == old_defender)
+        start_index = server.player_index[old_defender]
     
     server.attacker = players_by_number[start_index]
     server.defender = players_by_number[(start_index + 1) % len(players_by_number)]
-    server.table = []
+    server.table_attackers = []
+    server.table_defenders = []
+    server._allowed_ranks = set()
     
     # Refill hands
     await server.refill_hands()
     
     # Check win condition
     if len(server.players) == 1:
-        durak = list(server.players.values())[0]
+        durak = next(iter(server.players.values()))
         
         # Notify finished players with a compact message
-        for fin_author in server.finished_players:
+        for fin_author_id in server.finished_players:
             try:
-                await fin_author.send(f"🎮 Game over! ***{durak.author.display_name}*** is the Durak!")
+                fin_author = client.get_user(fin_author_id)
+                if fin_author:
+                    await fin_author.send(f"🎮 Game over! ***{durak.author.display_name}*** is the Durak!")
             except Exception as e:
                 logger.error(f"Error sending game over message: {str(e)}")
         
-        # Grant "Ultimate Durak" role
+        # Grant "Ultimate Durak" role; the cached id makes the lookup an
+        # O(1) get_role instead of a scan over every role in the guild
         try:
             guild = durak.channel.guild
-            durak_role = discord.utils.get(guild.roles, name="Ultimate Durak")
+            role_id = app.durak_role_ids.get(guild.id)
+            durak_role = guild.get_role(role_id) if role_id else None
+            if durak_role is None:
+                durak_role = discord.utils.get(guild.roles, name="Ultimate Durak")
             if not durak_role:
                 durak_role = await guild.create_role(name="Ultimate Durak", colour=discord.Colour.dark_red())
+            app.durak_role_ids[guild.id] = durak_role.id
             
             await durak.author.add_roles(durak_role)
         except Exception as e:
@@ -966,12 +1204,15 @@ async def end_turn(server, turn_taken):
             server.trump_card = Card(server.trump_card.rank, server.trump_card.original_suit)
             server.trump_taken = True
     
-    # Update all displays
-    for player in server.players:
-        try:
-            await server.update_hand(server.players[player])
-        except Exception as e:
-            logger.error(f"Error updating hand: {str(e)}")
+    # Update all displays: the per-player hand edits are independent, so
+    # fan them out and log individual failures from the results
+    results = await asyncio.gather(
+        *(server.update_hand(p) for p in server.players.values()),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error(f"Error updating hand: {str(result)}")
     
     await server.update_table()
     
@@ -990,73 +1231,80 @@ async def start_game_internal(server, channel):
     server.state = GameState.PLAYING
     server.initialize_deck()
     server.attacker = None
-    lowest_trump = None
     
     # Clean up setup message
     if server.setup_message:
-        try:
-            await server.setup_message.delete()
-        except:
-            pass
+        await safe_delete_message(server.setup_message)
         server.setup_message = None
 
-    # Create player channels and deal cards
-    for player in server.players:
-        # Create role for the player
-        role_name = f'durak {server.players[player].number}'
-        try:
+    # Deal hands first (pure Python, keeps lowest-trump detection in join
+    # order), then provision roles and channels for all players at once
+    for p in server.players.values():
+        p.hand = sorted((server.deck.popleft() for _ in range(6)), key=_SORT_KEY)
+        p._hand_set = set(p.hand)
+
+    # Lowest trump in anyone's hand decides the first attacker
+    trump_suit = server.trump_card.suit
+    candidates = [(p, c) for p in server.players.values() for c in p.hand
+                  if c.suit == trump_suit]
+    if candidates:
+        server.attacker, _ = min(candidates, key=lambda pc: pc[1].rank_int)
+    
+    # A few players in flight at a time keeps us under the guild rate limits
+    setup_semaphore = asyncio.Semaphore(5)
+    
+    async def setup_player(p):
+        player = p.author
+        async with setup_semaphore:
+            # Create role for the player
+            role_name = f'durak {p.number}'
             role = await channel.guild.create_role(name=role_name, colour=discord.Colour.random())
+            server.role_cache[role_name] = role
             await player.add_roles(role)
-        except Exception as e:
-            logger.error(f"Error creating role: {str(e)}")
-            await channel.send("Failed to create roles. Check bot permissions.")
-            return
-        
-        # Create private channel
-        channel_name = f'durak-{player.display_name}-room'.lower().replace(' ', '-')
-        try:
+            
+            # Create private channel
+            channel_name = f'durak-{player.display_name}-room'.lower().replace(' ', '-')
             player_channel = await channel.guild.create_text_channel(channel_name)
             await player_channel.set_permissions(role, send_messages=True, read_messages=True)
             await player_channel.set_permissions(channel.guild.default_role, read_messages=False)
-        except Exception as e:
-            logger.error(f"Error creating channel: {str(e)}")
-            await channel.send("Failed to create channels. Check bot permissions.")
+            p.channel = player_channel
+    
+    results = await asyncio.gather(
+        *(setup_player(p) for p in server.players.values()),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error(f"Error setting up player: {str(result)}")
+            await channel.send("Failed to create roles or channels. Check bot permissions.")
             return
-        
-        # Set up player
-        p = server.players[player]
-        p.channel = player_channel
-        p.hand = [server.deck.pop(0) for _ in range(6)]
-        
-        # Check for lowest trump
-        for card in p.hand:
-            if card.suit == server.trump_card.suit:
-                if lowest_trump is None or server.card_ranks[card.rank] < server.card_ranks[lowest_trump]:
-                    lowest_trump = card.rank
-                    server.attacker = p
-    
-    # Send welcome message to each player
-    for player in server.players:
-        p = server.players[player]
-        
-        # Send compact welcome message
-        players_list = ", ".join([player.display_name for player in server.players])
-        welcome_text = (
-            f"**Welcome to Durak!** Players: {players_list}\n"
-            f"• Click action buttons: {PLAY_EMOJI} {DEFEND_EMOJI} {TAKE_EMOJI} {GIVEUP_EMOJI}\n"
-            f"• Select cards with number reactions, confirm with {CONFIRM_EMOJI}, cancel with {CANCEL_EMOJI}"
-        )
+    
+    # Send welcome message to each player; the text is identical for
+    # everyone, so build it once
+    players_list = ", ".join(q.author.display_name for q in server.players.values())
+    welcome_text = (
+        f"**Welcome to Durak!** Players: {players_list}\n"
+        f"• Click action buttons: {PLAY_EMOJI} {DEFEND_EMOJI} {TAKE_EMOJI} {GIVEUP_EMOJI}\n"
+        f"• Select cards with number reactions, confirm with {CONFIRM_EMOJI}, cancel with {CANCEL_EMOJI}"
+    )
+    
+    async def welcome_player(p):
         await p.channel.send(welcome_text)
         
         # Send initial hand
         await server.update_hand(p)
+    
+    await asyncio.gather(
+        *(welcome_player(p) for p in server.players.values()),
+        return_exceptions=True
+    )
 
     # Set initial attacker and defender
     if server.attacker is None:
-        server.attacker = list(server.players.values())[0]
+        server.attacker = next(iter(server.players.values()))
 
-    players_by_number = sorted(server.players.values(), key=lambda p: p.number)
-    attacker_index = next(i for i, p in enumerate(players_by_number) if p == server.attacker)
+    players_by_number = server.players_by_number
+    attacker_index = server.player_index[server.attacker]
     defender_index = (attacker_index + 1) % len(players_by_number)
     server.defender = players_by_number[defender_index]
 
@@ -1085,25 +1333,26 @@ async def delete_all(ctx):
     """Delete all Durak game channels and roles (admin only)."""
     guild = ctx.guild
     
-    # Delete roles
+    # Deleting a channel drops its messages with it, so there is nothing
+    # to purge first; just batch all the role and channel deletions
     roles_to_delete = [role for role in guild.roles if role.name.startswith("durak")]
-    for role in roles_to_delete:
-        try:
-            await role.delete()
-            await ctx.send(f'Deleted role: {role.name}')
-        except Exception as e:
-            logger.error(f"Error deleting role: {str(e)}")
-            await ctx.send(f'Failed to delete role: {role.name}')
-    
-    # Delete channels
     channels_to_delete = [channel for channel in guild.text_channels if channel.name.startswith("durak")]
-    for channel in channels_to_delete:
-        try:
-            await channel.delete()
-            await ctx.send(f'Deleted channel: {channel.name}')
-        except Exception as e:
-            logger.error(f"Error deleting channel: {str(e)}")
-            await ctx.send(f'Failed to delete channel: {channel.name}')
+    
+    targets = roles_to_delete + channels_to_delete
+    results = await asyncio.gather(*(t.delete() for t in targets), return_exceptions=True)
+    
+    deleted, failed = [], []
+    for target, result in zip(targets, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error deleting {target.name}: {str(result)}")
+            failed.append(target.name)
+        else:
+            deleted.append(target.name)
+    
+    if deleted:
+        await ctx.send(f"Deleted: {', '.join(deleted)}")
+    if failed:
+        await ctx.send(f"Failed to delete: {', '.join(failed)}")
 
 @client.command(name='help_durak')
 async def help_durak(ctx):
@@ -1,20 +1,50 @@
 import discord
 from discord.ext import commands
 import asyncio
-from typing import List, Callable, Any
-from config import logger
+from typing import Awaitable, List
+from config import GameState, logger
 
-async def batch_discord_operations(operations: List[Callable[[], Any]], chunk_size: int = 5) -> None:
+async def batch_discord_operations(operations: List[Awaitable], chunk_size: int = 5) -> None:
     """
-    Execute Discord API operations in batches to avoid rate limits.
-    
+    Execute Discord API operations concurrently, bounded to avoid rate limits.
+
+    Args:
+        operations: List of coroutine objects to await
+        chunk_size: Maximum number of operations in flight at once
+    """
+    semaphore = asyncio.Semaphore(chunk_size)
+
+    async def _bounded(coro):
+        async with semaphore:
+            return await coro
+
+    await asyncio.gather(*(_bounded(coro) for coro in operations), return_exceptions=True)
+
+async def delete_with_retry(target, semaphore: asyncio.Semaphore, max_retries: int = 3) -> bool:
+    """
+    Delete a Discord object (role, channel, message) under a shared semaphore,
+    backing off and retrying when Discord rate-limits the request.
+
     Args:
-        operations: List of async callables to execute
-        chunk_size: Number of operations to execute in parallel
+        target: Object with an async delete() method
+        semaphore: Semaphore bounding in-flight deletions
+        max_retries: Number of retries after a 429 response
     """
-    for i in range(0, len(operations), chunk_size):
-        chunk = operations[i:i+chunk_size]
-        await asyncio.gather(*[op() for op in chunk], return_exceptions=True)
+    async with semaphore:
+        for attempt in range(max_retries + 1):
+            try:
+                await target.delete()
+                return True
+            except discord.errors.Forbidden:
+                logger.warning(f"No permission to delete {target}")
+                return False
+            except discord.HTTPException as e:
+                if e.status == 429 and attempt < max_retries:
+                    await asyncio.sleep(getattr(e, 'retry_after', None) or 2 ** attempt)
+                    continue
+                logger.error(f"Error deleting {target}: {str(e)}")
+                return False
+    return False
 
 async def safe_delete_message(message) -> bool:
     """Safely delete a Discord message, handling exceptions."""
@@ -76,6 +106,15 @@ def is_player_turn(attacker=False, defender=False):
         return True
     return commands.check(predicate)
 
+def in_player_channel():
+    """Check decorator to ensure the command was sent from the player's own channel."""
+    async def predicate(ctx):
+        app = ctx.bot.get_cog('DurakGame').app
+        server = app.get_server(ctx.guild)
+        player = server.get_player(ctx.author)
+        return player is not None and ctx.channel == player.channel
+    return commands.check(predicate)
+
 def create_card_embed(title, player=None, cards=None, trump=None, deck_size=None):
     """Create a Discord embed for displaying card information."""
     embed = discord.Embed(title=title, color=discord.Color.blue())